@@ -1,269 +1,150 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
+import plotly.express as px
 import datetime
+import math
 import os
-from datetime import date, timedelta
-
-# Nome do arquivo para salvar os jogos agendados
-SCHEDULE_FILE = "agendamentos.csv"
-RESULTS_FILE = "resultados.csv"
-
-# Função para carregar os jogos agendados do arquivo CSV
-def load_schedule():
-    if os.path.exists(SCHEDULE_FILE):
-        return pd.read_csv(SCHEDULE_FILE, parse_dates=["Data"])
-    return pd.DataFrame(columns=["Data", "Horario", "Classe", "Grupo", "Jogador1", "Jogador2"])
-
-# Função para salvar os jogos agendados no arquivo CSV
-def save_schedule(schedule):
-    schedule.to_csv(SCHEDULE_FILE, index=False)
-
-# Função para limpar o arquivo agendamentos.csv
+from datetime import timedelta
+from cache import file_signature, frame_cache
+from calendar_html import calendar_html
+from calendar_index import calendar_index
+from fixtures import DEFAULT_MAX_PER_DAY, generate_fixtures, players_by_group
+from importer import import_fixtures
+from profiling import profiler
+from public import PUBLIC_DIR
+from storage import SCHEDULE_COLUMNS
+from tournaments import TOURNAMENTS_FILE, TournamentRegistry
+
+# Função para limpar o arquivo de agendamentos do torneio
 def limpar_agendamentos():
-    if os.path.exists("agendamentos.csv"):
-        os.remove("agendamentos.csv")
-        st.session_state.schedule = pd.DataFrame(columns=["Data", "Horario", "Classe", "Grupo", "Jogador1", "Jogador2"])
-        st.success("Arquivo agendamentos.csv limpo com sucesso!")
+    if dados.schedule_store.clear():
+        st.session_state.schedule = pd.DataFrame(columns=SCHEDULE_COLUMNS)
+        st.success(f"Arquivo {torneio.schedule_file} limpo com sucesso!")
     else:
-        st.warning("O arquivo agendamentos.csv não existe.")
-
-# Adicione um botão para limpar o arquivo
-if st.button("Limpar arquivo agendamentos.csv"):
-    limpar_agendamentos()
-# Função para carregar os resultados dos jogos
-def load_results():
-    if os.path.exists(RESULTS_FILE):
-        return pd.read_csv(RESULTS_FILE, parse_dates=["Data"])
-    return pd.DataFrame(columns=["Data", "Horario", "Classe", "Grupo", "Jogador1", "Jogador2", "Vencedor", "Sets_Jogador1", "Sets_Jogador2", "Games_Jogador1", "Games_Jogador2", "Tiebreaks_Jogador1", "Tiebreaks_Jogador2"])
-
-# Função para salvar os resultados dos jogos no arquivo CSV
-def save_results(results):
-    results.to_csv(RESULTS_FILE, index=False)
-
-# Função para criar o calendário
-def create_calendar(start_date, end_date, schedule):
-    calendar = {}
-    current_date = start_date
-    while current_date <= end_date:
-        calendar[current_date] = 0
-        current_date += timedelta(days=1)
-    
-    for game_date in schedule["Data"]:
-        if game_date.date() in calendar:
-            calendar[game_date.date()] += 1
-    
-    return calendar
+        st.warning(f"O arquivo {torneio.schedule_file} não existe.")
 
 # Função para exibir o calendário de forma visual
 def display_calendar(calendar, current_month):
     st.write("### Calendário de Jogos")
-    
-    # Dias da semana
-    dias_semana = ["Seg", "Ter", "Qua", "Qui", "Sex", "Sáb", "Dom"]
-    
-    # Cria uma tabela para o calendário
-    colunas = st.columns(7)
-    
-    # Exibe os dias da semana como cabeçalho
-    for i, dia in enumerate(dias_semana):
-        colunas[i].write(f"**{dia}**")
-    
-    # Exibe os dias do mês
-    current_date = date(current_month.year, current_month.month, 1)
-    
-    # Encontra o dia da semana do primeiro dia do mês (0 = Segunda, 6 = Domingo)
-    first_day_weekday = current_date.weekday()  # weekday() retorna 0 para Segunda, 6 para Domingo
-    
-    # Preenche os dias vazios no início do mês
-    for i in range(first_day_weekday):
-        colunas[i].write("")  # Espaço vazio para alinhar o primeiro dia do mês
-    
-    # Exibe os dias do mês
-    while current_date.month == current_month.month:
-        # Define a cor do fundo com base no número de jogos
-        count = calendar.get(current_date, 0)
-        if count == 0:
-            color = "#BBDEFB"  # Azul mais escuro
-        elif 1 <= count <= 2:
-            color = "#FFF59D"  # Amarelo mais escuro
-        else:
-            color = "#EF9A9A"  # Vermelho mais escuro
-        
-        # Exibe o dia no calendário
-        col_index = current_date.weekday()  # 0 = Segunda, 6 = Domingo
-        with colunas[col_index]:
-            st.markdown(
-                f"<div style='background-color:{color}; padding:10px; margin:2px; border-radius:5px; text-align:center; color:black;'>"
-                f"<strong>{current_date.day}</strong><br>{count} jogo(s)"
-                f"</div>",
-                unsafe_allow_html=True
-            )
-        
-        current_date += timedelta(days=1)
-        
-        # Se o dia da semana for Domingo (6), pula para a próxima linha
-        if current_date.weekday() == 0:
-            st.write("")  # Adiciona uma linha em branco para separar as semanas
-
-    # Adiciona navegação entre meses
-    st.write("---")
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col1:
-        if st.button("Mês Anterior"):
-            st.session_state.current_month = (current_month.replace(day=1) - timedelta(days=1)).replace(day=1)
-            st.rerun()
-    with col3:
-        if st.button("Próximo Mês"):
-            st.session_state.current_month = (current_month.replace(day=28) + timedelta(days=4)).replace(day=1)
-            st.rerun()
-    with col2:
-        st.write(f"**Mês Atual:** {current_month.strftime('%B %Y')}")
-
-# Função para avaliar a meta de jogos por semana
-def evaluate_weekly_goal(schedule, start_date, end_date):
-    weekly_goals = {}
-    current_date = start_date
-    while current_date <= end_date:
-        week_start = datetime.datetime.combine(current_date, datetime.time(0, 0))  # Converte para datetime
-        week_end = week_start + timedelta(days=6)
-        games_in_week = len(schedule[(schedule["Data"] >= week_start) & (schedule["Data"] <= week_end)])
-        weekly_goals[current_date] = games_in_week
-        current_date = week_end.date() + timedelta(days=1)
-    
-    return weekly_goals
 
-# Função para excluir um jogo
-def delete_game(index):
-    st.session_state.schedule = st.session_state.schedule.drop(index).reset_index(drop=True)
-    save_schedule(st.session_state.schedule)
-    st.success("Jogo excluído com sucesso!")
+    # O calendário inteiro (meses do torneio e os vizinhos) é um único HTML, guardado em cache
+    # pelas contagens diárias; a troca de mês acontece no navegador, sem reexecutar o script
+    calendario_html, altura = calendar_html(calendar, current_month, key=f"calendario-{torneio.id}")
+    if hasattr(st, "iframe"):
+        st.iframe(calendario_html, height=altura)
+    else:  # versões do Streamlit anteriores ao st.iframe
+        components.html(calendario_html, height=altura)
+
+# Função para excluir jogos (uma única gravação para todos os selecionados)
+def delete_games(games):
+    dados.conflicts.apply(games, *dados.schedule_store.delete(games), step=-1)
+    st.success(f"{len(games)} jogo(s) excluído(s) com sucesso!")
     st.rerun()  # Recarrega a página para atualizar a lista
 
-# Função para calcular estatísticas por grupo
-def calculate_group_stats(results, group):
-    stats = {}
-    for _, row in results[results["Grupo"] == group].iterrows():
-        jogador1 = row["Jogador1"]
-        jogador2 = row["Jogador2"]
-        vencedor = row["Vencedor"]
-        sets_jogador1 = row["Sets_Jogador1"]
-        sets_jogador2 = row["Sets_Jogador2"]
-        games_jogador1 = row["Games_Jogador1"]
-        games_jogador2 = row["Games_Jogador2"]
-        tiebreaks_jogador1 = row["Tiebreaks_Jogador1"]
-        tiebreaks_jogador2 = row["Tiebreaks_Jogador2"]
-
-        # Inicializa as estatísticas dos jogadores, se necessário
-        if jogador1 not in stats:
-            stats[jogador1] = {"Jogos": 0, "Vitórias": 0, "Derrotas": 0, "Sets_Ganhos": 0, "Sets_Perdidos": 0, "Games_Ganhos": 0, "Games_Perdidos": 0, "Tiebreaks_Ganhos": 0, "Tiebreaks_Perdidos": 0}
-        if jogador2 not in stats:
-            stats[jogador2] = {"Jogos": 0, "Vitórias": 0, "Derrotas": 0, "Sets_Ganhos": 0, "Sets_Perdidos": 0, "Games_Ganhos": 0, "Games_Perdidos": 0, "Tiebreaks_Ganhos": 0, "Tiebreaks_Perdidos": 0}
-
-        # Atualiza as estatísticas dos jogadores
-        stats[jogador1]["Jogos"] += 1
-        stats[jogador2]["Jogos"] += 1
-
-        if vencedor == jogador1:
-            stats[jogador1]["Vitórias"] += 1
-            stats[jogador2]["Derrotas"] += 1
-        else:
-            stats[jogador2]["Vitórias"] += 1
-            stats[jogador1]["Derrotas"] += 1
-
-        stats[jogador1]["Sets_Ganhos"] += sets_jogador1
-        stats[jogador1]["Sets_Perdidos"] += sets_jogador2
-        stats[jogador2]["Sets_Ganhos"] += sets_jogador2
-        stats[jogador2]["Sets_Perdidos"] += sets_jogador1
-
-        stats[jogador1]["Games_Ganhos"] += games_jogador1
-        stats[jogador1]["Games_Perdidos"] += games_jogador2
-        stats[jogador2]["Games_Ganhos"] += games_jogador2
-        stats[jogador2]["Games_Perdidos"] += games_jogador1
-
-        stats[jogador1]["Tiebreaks_Ganhos"] += tiebreaks_jogador1
-        stats[jogador1]["Tiebreaks_Perdidos"] += tiebreaks_jogador2
-        stats[jogador2]["Tiebreaks_Ganhos"] += tiebreaks_jogador2
-        stats[jogador2]["Tiebreaks_Perdidos"] += tiebreaks_jogador1
-
-    # Converte as estatísticas em um DataFrame
-    stats_df = pd.DataFrame.from_dict(stats, orient="index")
-    stats_df["Saldo_Sets"] = stats_df["Sets_Ganhos"] - stats_df["Sets_Perdidos"]
-    stats_df["Saldo_Games"] = stats_df["Games_Ganhos"] - stats_df["Games_Perdidos"]
-    stats_df["Saldo_Tiebreaks"] = stats_df["Tiebreaks_Ganhos"] - stats_df["Tiebreaks_Perdidos"]
-
-    # Ordena os jogadores por vitórias, saldo de sets, saldo de games e saldo de tiebreaks
-    stats_df = stats_df.sort_values(by=["Vitórias", "Saldo_Sets", "Saldo_Games", "Saldo_Tiebreaks"], ascending=False)
-    return stats_df
+# Tempos de cada seção desta execução (painel de desempenho: ?admin=1)
+perf = profiler.start()
+
+# Opções de jogos por página na lista de jogos agendados
+PAGE_SIZES = [25, 50, 100]
+
+# Cadastro de torneios, compartilhado entre as sessões (recriado se torneios.json mudar)
+@st.cache_resource(max_entries=1)
+def get_registry(signature):
+    return TournamentRegistry(TOURNAMENTS_FILE)
+
+registry = get_registry(file_signature(TOURNAMENTS_FILE))
+
+# Seleção do torneio (também pela URL: ?torneio=<id>)
+torneio_ids = registry.ids()
+torneio_url = st.query_params.get("torneio")
+torneio_id = st.sidebar.selectbox(
+    "Torneio",
+    torneio_ids,
+    index=torneio_ids.index(torneio_url) if torneio_url in torneio_ids else 0,
+    format_func=lambda torneio_id: registry.get(torneio_id).nome,
+)
+st.query_params["torneio"] = torneio_id
+torneio = registry.get(torneio_id)
+# Os dados do torneio só são abertos no primeiro acesso
+dados = registry.data(torneio_id)
+
+# Ao trocar de torneio, descarta o estado da sessão do torneio anterior
+if st.session_state.get("torneio_id") != torneio_id:
+    for key in ("schedule", "results", "current_month", "jogos_gerados"):
+        st.session_state.pop(key, None)
+    st.session_state.torneio_id = torneio_id
+
+perf.lap("torneio")
+
+# Adicione um botão para limpar o arquivo
+if st.button(f"Limpar arquivo {torneio.schedule_file}"):
+    limpar_agendamentos()
 
 # Inicialização do Streamlit
 st.title("🎾 Agendamento de Jogos do Torneio de Tênis")
 
 # Definição do período do torneio
-start_date = date(2025, 2, 3)
-end_date = date(2025, 3, 16)
+start_date = torneio.start_date
+end_date = torneio.end_date
+
+# Metas do torneio: jogos por semana e total de jogos
+meta_semanal = torneio.meta_semanal
+meta_total = torneio.meta_total
 
 # Lista de jogadores
-jogadores = [
-    "Airton Barata", "Augusto E", "Carlos Frederico", "Danilo Alves", "Fernando Lino",
-    "Joel Pereira", "José Humberto", "Luiz Jr", "Lupesse Santana", "Matheus C",
-    "Túlio Ourique", "Vinicius Paiva", "Walmir Irineu", "Walter C", "Warwick Melo", "Willian F"
-]
+jogadores = torneio.jogadores
 
 # Inicialização do estado
 if 'schedule' not in st.session_state:
-    st.session_state.schedule = load_schedule()
+    st.session_state.schedule, st.session_state.schedule_signature = dados.schedule_store.load_signed(start_date, end_date)
     st.session_state.jogos_carregados = False  # Flag para indicar se os jogos pré-cadastrados já foram carregados
+elif st.session_state.schedule_signature != dados.schedule_store.signature():
+    # Outra sessão gravou jogos desde a última leitura
+    st.session_state.schedule, st.session_state.schedule_signature = dados.schedule_store.load_signed(start_date, end_date)
+perf.lap("carregar agenda")
     
-def jogo_ja_existe(jogo, schedule):
-    return ((schedule["Data"] == jogo["Data"]) &
-            (schedule["Horario"] == jogo["Horario"]) &
-            (schedule["Classe"] == jogo["Classe"]) &
-            (schedule["Grupo"] == jogo["Grupo"]) &
-            (schedule["Jogador1"] == jogo["Jogador1"]) &
-            (schedule["Jogador2"] == jogo["Jogador2"])).any()
-
-# Carregar os jogos pré-cadastrados (apenas uma vez)
-if os.path.exists("jogos_pre_cadastrados.csv") and not st.session_state.jogos_carregados:
-    pre_cadastrados = pd.read_csv("jogos_pre_cadastrados.csv", parse_dates=["Data"])
-    
-    # Adicionar apenas os jogos que ainda não estão no schedule
-    novos_jogos = []
-    for _, jogo in pre_cadastrados.iterrows():
-        # Converter a string de horário para um objeto datetime.time
-        horario = datetime.datetime.strptime(jogo["Horario"], "%H:%M").time()
-        # Combinar data e horário
-        data_horario = datetime.datetime.combine(jogo["Data"].date(), horario)
-        # Criar um novo jogo com a data e horário combinados
-        novo_jogo = {
-            "Data": data_horario,
-            "Horario": jogo["Horario"],
-            "Classe": jogo["Classe"],
-            "Grupo": jogo["Grupo"],
-            "Jogador1": jogo["Jogador1"],
-            "Jogador2": jogo["Jogador2"]
-        }
-        # Verificar se o jogo já existe no schedule
-        if not jogo_ja_existe(novo_jogo, st.session_state.schedule):
-            novos_jogos.append(novo_jogo)
-    
-    if novos_jogos:
-        novos_jogos_df = pd.DataFrame(novos_jogos)
+# Índice de conflitos (jogador por horário e por dia, quadras por horário) do torneio, montado uma vez e mantido a cada gravação
+dados.conflicts.sync(dados.schedule_store.signature(), lambda: dados.schedule_store.load_signed(start_date, end_date))
+perf.lap("índice de conflitos")
+
+# Carregar os jogos pré-cadastrados (apenas uma vez), só os que ainda não estão na agenda
+if os.path.exists(torneio.pre_registered_file) and not st.session_state.jogos_carregados:
+    novos_jogos_df = import_fixtures(torneio.pre_registered_file, dry_run=True, store=dados.schedule_store)
+    if not novos_jogos_df.empty:
+        # Os conflitos são apontados em relação à agenda de antes da importação
+        conflitos_df = dados.conflicts.report(novos_jogos_df)
+        dados.conflicts.apply(novos_jogos_df, *dados.schedule_store.append(novos_jogos_df))
         st.session_state.schedule = pd.concat([st.session_state.schedule, novos_jogos_df], ignore_index=True)
-        save_schedule(st.session_state.schedule)
-        st.success(f"{len(novos_jogos)} jogos pré-cadastrados adicionados com sucesso!")
+        st.success(f"{len(novos_jogos_df)} jogos pré-cadastrados adicionados com sucesso!")
+        if not conflitos_df.empty:
+            st.warning(f"{len(conflitos_df)} jogo(s) pré-cadastrado(s) com conflito de agenda:")
+            st.dataframe(conflitos_df, hide_index=True)
     
     st.session_state.jogos_carregados = True  # Marca os jogos como carregados
+perf.lap("importar pré-cadastrados")
 
 # Carregar os resultados dos jogos
-if 'results' not in st.session_state:
-    st.session_state.results = load_results()
+if 'results' not in st.session_state or st.session_state.results_signature != dados.results_store.signature():
+    st.session_state.results, st.session_state.results_signature = dados.load_results_signed()
+perf.lap("carregar resultados")
+
+# Classificação, ranking Elo e índice de jogadores (histórico e confrontos diretos) do torneio,
+# compartilhados entre as sessões e atualizados a cada resultado salvo; só são recalculados
+# se o arquivo de resultados foi alterado fora do app
+standings_store = dados.standings
+dados.sync_results(lap=perf.lap)
+
+# Uso do cache de dados compartilhado entre as sessões
+cache_stats = frame_cache.stats()
+st.sidebar.caption(f"Cache de dados: {cache_stats['hits']} acertos / {cache_stats['misses']} falhas ({cache_stats['entries']} entradas)")
 
 # Inicializar o mês atual no session_state
 if 'current_month' not in st.session_state:
     st.session_state.current_month = start_date.replace(day=1)  # Começa no primeiro dia do mês inicial
 
 # Abas para agendamento e resultados
-tab1, tab2 = st.tabs(["Agendamento de Jogos", "Resultados e Estatísticas"])
+tab1, tab2, tab3 = st.tabs(["Agendamento de Jogos", "Resultados e Estatísticas", "Jogador"])
 
 with tab1:
     # Seção para agendar novos jogos
@@ -275,18 +156,22 @@ with tab1:
         with col2:
             game_time = st.time_input("Horário do Jogo", value=datetime.time(10, 0))  # Horário padrão: 10:00
         
-        class_type = st.selectbox("Classe", ["B", "C", "D"])
-        group = st.selectbox("Grupo", [1, 2, 3, 4])
+        class_type = st.selectbox("Classe", torneio.classes)
+        group = st.selectbox("Grupo", torneio.grupos)
         player1 = st.selectbox("Jogador 1", options=jogadores)
         player2 = st.selectbox("Jogador 2", options=jogadores)
         submit_button = st.form_submit_button("Agendar Jogo")
 
         if submit_button:
+            # Combina data e horário em um único campo de data/hora
+            game_datetime = datetime.datetime.combine(game_date, game_time)
+            # Jogador já escalado no horário (ou no limite de jogos do dia) ou horário sem quadra livre
+            conflitos = dados.conflicts.check({"Data": game_datetime, "Jogador1": player1, "Jogador2": player2})
             if player1 == player2:
                 st.error("Os jogadores devem ser diferentes.")
+            elif conflitos:
+                st.error(f"Conflito de agenda: {'; '.join(conflitos)}.")
             else:
-                # Combina data e horário em um único campo de data/hora
-                game_datetime = datetime.datetime.combine(game_date, game_time)
                 new_game = pd.DataFrame({
                     "Data": [game_datetime],
                     "Horario": [game_time.strftime("%H:%M")],  # Salva o horário separadamente
@@ -296,12 +181,53 @@ with tab1:
                     "Jogador2": [player2]
                 })
                 st.session_state.schedule = pd.concat([st.session_state.schedule, new_game], ignore_index=True)
-                save_schedule(st.session_state.schedule)
+                dados.conflicts.apply(new_game, *dados.schedule_store.append(new_game))
                 st.success(f"✅ Jogo agendado para {game_datetime.strftime('%d/%m/%Y %H:%M')} entre {player1} e {player2} (Grupo {group}, Classe {class_type}).")
 
+    perf.lap("formulário de agendamento")
+
+    # Geração automática dos jogos que faltam (todos contra todos em cada grupo)
+    with st.expander("⚙️ Gerar tabela automaticamente"):
+        grupos_jogadores = torneio.grupos_jogadores or players_by_group(st.session_state.schedule)
+        if not grupos_jogadores:
+            st.write("Cadastre os jogadores de cada grupo em torneios.json (grupos_jogadores) ou agende ao menos um jogo por grupo.")
+        else:
+            st.write(
+                f"{len(grupos_jogadores)} grupo(s), {sum(len(players) for players in grupos_jogadores.values())} jogadores, "
+                f"{torneio.quadras} quadra(s) nos horários {', '.join(torneio.horarios)}."
+            )
+            if st.button("Gerar jogos pendentes"):
+                st.session_state.jogos_gerados = generate_fixtures(
+                    grupos_jogadores,
+                    start_date,
+                    end_date,
+                    time_slots=torneio.horarios,
+                    courts=torneio.quadras,
+                    unavailable=torneio.indisponibilidade,
+                    existing=st.session_state.schedule,
+                    max_per_day=torneio.max_jogos_dia or DEFAULT_MAX_PER_DAY,
+                    weekly_target=meta_semanal,
+                )
+            if 'jogos_gerados' in st.session_state:
+                jogos_gerados, jogos_pendentes = st.session_state.jogos_gerados
+                st.write(f"**{len(jogos_gerados)} jogos gerados**")
+                st.dataframe(jogos_gerados, hide_index=True)
+                if not jogos_pendentes.empty:
+                    st.warning(f"{len(jogos_pendentes)} confronto(s) não couberam no período com as quadras, os horários e a meta semanal ({meta_semanal} jogos).")
+                    st.dataframe(jogos_pendentes, hide_index=True)
+                if not jogos_gerados.empty and st.button("Salvar jogos gerados"):
+                    dados.conflicts.apply(jogos_gerados, *dados.schedule_store.append(jogos_gerados))
+                    del st.session_state.jogos_gerados
+                    st.rerun()
+
+    perf.lap("gerar tabela")
+
     # Exibe o calendário
-    calendar = create_calendar(start_date, end_date, st.session_state.schedule)
+    # Contagens por dia e por semana, recalculadas só quando a agenda muda
+    calendar = calendar_index(st.session_state.schedule, start_date, end_date)
+    perf.lap("calendário (índice)")
     display_calendar(calendar, st.session_state.current_month)
+    perf.lap("calendário (exibição)")
 
     # Exibição da lista de jogos agendados
     st.write("### 📜 Lista de Jogos Agendados")
@@ -319,7 +245,7 @@ with tab1:
         filter_by_class = st.checkbox("Filtrar por classe")
         selected_class = None
         if filter_by_class:
-            selected_class = st.selectbox("Selecione a classe", ["B", "C", "D"])
+            selected_class = st.selectbox("Selecione a classe", torneio.classes)
 
         # Filtro por grupo (só aparece se uma classe for selecionada)
         filter_by_group = False
@@ -327,61 +253,69 @@ with tab1:
         if filter_by_class and selected_class:
             filter_by_group = st.checkbox("Filtrar por grupo")
             if filter_by_group:
-                selected_group = st.selectbox("Selecione o grupo", [1, 2, 3, 4])
+                selected_group = st.selectbox("Selecione o grupo", torneio.grupos)
 
     # Aplicar filtros (se selecionados)
-    filtered_schedule = st.session_state.schedule.copy()
-    
-    # Filtro por data
-    if filter_by_date and selected_date:
-        filtered_schedule = filtered_schedule[filtered_schedule["Data"].dt.date == selected_date]
-    
-    # Filtro por classe
-    if filter_by_class and selected_class:
-        filtered_schedule = filtered_schedule[filtered_schedule["Classe"] == selected_class]
-    
-    # Filtro por grupo
-    if filter_by_group and selected_group:
-        filtered_schedule = filtered_schedule[filtered_schedule["Grupo"] == selected_group]
-    
-    # Ordenar a lista de jogos por data (da mais recente para a mais futura)
-    filtered_schedule = filtered_schedule.sort_values(by="Data", ascending=True)
-
-    # Exibição da lista de jogos
-    if not filtered_schedule.empty:
-        for index, row in filtered_schedule.iterrows():
-            col1, col2, col3, col4, col5, col6 = st.columns([2, 1, 1, 1, 2, 2])
-            with col1:
-                st.write(f"**Data:** {row['Data'].strftime('%d/%m/%Y %H:%M')}")
-            with col2:
-                st.write(f"**Classe:** {row['Classe']}")
-            with col3:
-                st.write(f"**Grupo:** {row['Grupo']}")
-            with col4:
-                st.write(f"**Jogador 1:** {row['Jogador1']}")
-            with col5:
-                st.write(f"**Jogador 2:** {row['Jogador2']}")
-            with col6:
-                if st.button(f"Excluir Jogo {index + 1}", key=f"delete_{index}"):
-                    delete_game(index)
+    filtros = {
+        "start": start_date,
+        "end": end_date,
+        "data": selected_date if filter_by_date and selected_date else None,
+        "classe": selected_class if filter_by_class and selected_class else None,
+        "grupo": selected_group if filter_by_group and selected_group else None,
+    }
+    total_filtrado = dados.schedule_store.count(**filtros)
+
+    # Exibição da lista de jogos, paginada: só a página visível é consultada e desenhada
+    if total_filtrado > 0:
+        col1, col2 = st.columns(2)
+        with col1:
+            page_size = st.selectbox("Jogos por página", PAGE_SIZES, index=1)
+        total_paginas = math.ceil(total_filtrado / page_size)
+        with col2:
+            pagina = st.number_input(f"Página (de {total_paginas})", min_value=1, max_value=total_paginas, value=1, step=1)
+
+        # A consulta já retorna os jogos ordenados por data (da mais recente para a mais futura)
+        page_schedule = dados.schedule_store.query(limit=page_size, offset=(pagina - 1) * page_size, **filtros)
+        tabela = pd.DataFrame({
+            "Data": page_schedule["Data"].dt.strftime("%d/%m/%Y %H:%M"),
+            "Classe": page_schedule["Classe"],
+            "Grupo": page_schedule["Grupo"],
+            "Jogador 1": page_schedule["Jogador1"],
+            "Jogador 2": page_schedule["Jogador2"],
+            "Excluir": False,
+        })
+        editado = st.data_editor(
+            tabela,
+            hide_index=True,
+            disabled=["Data", "Classe", "Grupo", "Jogador 1", "Jogador 2"],
+            column_config={"Excluir": st.column_config.CheckboxColumn("Excluir", help="Marque os jogos a excluir")},
+            # A chave muda quando a agenda muda, descartando seleções de linhas que não existem mais
+            key=f"lista_jogos_{hash(st.session_state.schedule_signature)}_{pagina}_{page_size}",
+        )
+        selecionados = editado["Excluir"].to_numpy(dtype=bool)
+        st.caption(f"Exibindo {len(page_schedule)} de {total_filtrado} jogos.")
+        if st.button(f"Excluir jogos selecionados ({int(selecionados.sum())})", disabled=not selecionados.any()):
+            delete_games(page_schedule[selecionados])
     else:
         st.write("Nenhum jogo encontrado com os filtros selecionados.")
+    perf.lap("lista de jogos")
 
    # Exibição do total de jogos agendados
-    st.write(f"### 📋 Total de Jogos Agendados: {len(st.session_state.schedule)}/48")
+    st.write(f"### 📋 Total de Jogos Agendados: {len(st.session_state.schedule)}/{meta_total}")
 
     # Avaliação da meta de jogos por semana
     st.write("### 📊 Avaliação de Jogos por Semana")
-    weekly_goals = evaluate_weekly_goal(st.session_state.schedule, start_date, end_date)
+    weekly_goals = calendar.weekly()
     for week_start, games_in_week in weekly_goals.items():
         week_end = week_start + timedelta(days=6)
-        st.write(f"**Semana de {week_start.strftime('%d/%m/%Y')} a {week_end.strftime('%d/%m/%Y')}:** {games_in_week} jogos agendados (Meta: 10 jogos)")
-        if games_in_week < 10:
+        st.write(f"**Semana de {week_start.strftime('%d/%m/%Y')} a {week_end.strftime('%d/%m/%Y')}:** {games_in_week} jogos agendados (Meta: {meta_semanal} jogos)")
+        if games_in_week < meta_semanal:
             st.error("Meta não atingida.")
-        elif games_in_week > 10:
+        elif games_in_week > meta_semanal:
             st.warning("Meta excedida.")
         else:
             st.success("Meta atingida.")
+    perf.lap("metas semanais")
 
 with tab2:
     st.write("### 🎾 Resultados dos Jogos")
@@ -444,10 +378,11 @@ with tab2:
                 })
                 
                 st.session_state.results = pd.concat([st.session_state.results, novo_resultado], ignore_index=True)
-                save_results(st.session_state.results)
+                dados.apply_result(novo_resultado, *dados.results_store.append(novo_resultado))
                 st.success("Resultado salvo com sucesso!")
         else:
             st.warning("Nenhum jogo agendado encontrado.")
+    perf.lap("formulário de resultados")
 
     # Exibição dos resultados
     st.write("### 📊 Resultados Registrados")
@@ -455,16 +390,79 @@ with tab2:
         st.dataframe(st.session_state.results)
     else:
         st.write("Nenhum resultado registrado ainda.")
+    perf.lap("lista de resultados")
 
     # Filtros para exibir estatísticas por grupo
     st.write("#### 🔍 Filtros para Estatísticas")
-    selected_class = st.selectbox("Selecione a classe", ["B", "C", "D"])
-    selected_group = st.selectbox("Selecione o grupo", [1, 2, 3, 4])
+    selected_class = st.selectbox("Selecione a classe", torneio.classes)
+    selected_group = st.selectbox("Selecione o grupo", torneio.grupos)
 
     # Calcula e exibe as estatísticas do grupo selecionado
     if not st.session_state.results.empty:
-        stats_df = calculate_group_stats(st.session_state.results, selected_group)
+        stats_df = standings_store.table(selected_class, selected_group)
         st.write(f"### 📈 Estatísticas do Grupo {selected_group} (Classe {selected_class})")
-        st.dataframe(stats_df)
+        if stats_df is not None:
+            st.dataframe(stats_df)
+        else:
+            st.write("Nenhum resultado registrado para este grupo.")
     else:
         st.write("Nenhum resultado registrado para calcular estatísticas.")
+    perf.lap("estatísticas do grupo")
+
+    # Ranking Elo e evolução dos ratings
+    st.write("### 🏅 Ranking (Elo)")
+    if not st.session_state.results.empty:
+        ranking_df = dados.ratings.table()
+        st.dataframe(ranking_df, hide_index=True)
+        selected_players = st.multiselect("Jogadores no gráfico", ranking_df["Jogador"], default=ranking_df["Jogador"].head(5).tolist())
+        if selected_players:
+            historico = dados.ratings.history(selected_players)
+            fig = px.line(historico, x="Data", y="Rating", color="Jogador", markers=True)
+            st.plotly_chart(fig)
+    else:
+        st.write("Nenhum resultado registrado para calcular o ranking.")
+    perf.lap("ranking (exibição)")
+
+with tab3:
+    st.write("### 👤 Perfil do Jogador")
+    jogadores_com_resultados = dados.players.players()
+    if jogadores_com_resultados:
+        jogador_selecionado = st.selectbox("Selecione o jogador", jogadores_com_resultados)
+        perfil = dados.players.profile(jogador_selecionado)
+        totais = perfil["totais"]
+
+        # Campanha e saldos
+        col1, col2, col3, col4, col5 = st.columns(5)
+        col1.metric("Jogos", totais["Jogos"])
+        col2.metric("Vitórias", totais["Vitórias"])
+        col3.metric("Derrotas", totais["Derrotas"])
+        col4.metric("Saldo de Sets", totais["Saldo_Sets"])
+        col5.metric("Saldo de Games", totais["Saldo_Games"])
+        if totais["Empates"]:
+            st.caption(f"{totais['Empates']} jogo(s) sem vencedor.")
+
+        # Forma recente (do jogo mais recente para o mais antigo)
+        st.write("#### 📅 Forma Recente")
+        st.write(" ".join({"V": "🟢", "D": "🔴", "E": "⚪"}[resultado] for resultado in perfil["recentes"]["Resultado"]))
+        st.dataframe(perfil["recentes"], hide_index=True)
+
+        # Confrontos diretos
+        st.write("#### 🤝 Confrontos Diretos")
+        st.dataframe(perfil["h2h"], hide_index=True)
+    else:
+        st.write("Nenhum resultado registrado ainda.")
+    perf.lap("perfil do jogador")
+
+# Snapshots públicos de classificação e agenda (somente leitura), regenerados só quando os dados mudam
+if PUBLIC_DIR:
+    dados.public_snapshots().publish()
+perf.lap("snapshots públicos")
+
+perf.finish(torneio=torneio_id)
+
+# Painel de desempenho (opcional, para administradores): percentis móveis do tempo de cada seção
+if st.query_params.get("admin") == "1":
+    with st.sidebar.expander("⏱️ Desempenho"):
+        st.dataframe(profiler.percentiles(), hide_index=True)
+        if st.button("Zerar medições"):
+            profiler.reset()
@@ -0,0 +1,51 @@
+# Benchmark do gerador de tabelas (todos contra todos) em ligas sintéticas.
+# Verifica que nenhum jogador passa do limite de jogos por dia nem joga duas vezes no mesmo horário, que nenhuma
+# quadra é usada duas vezes no mesmo horário e que nenhuma semana passa da meta semanal.
+# Uso: python -m benchmarks.bench_fixtures
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+
+from fixtures import generate_fixtures
+
+# Função para montar uma liga sintética: grupos de players_per_group jogadores em cada classe
+def synthetic_league(n_players, players_per_group=8, classes=("A", "B", "C", "D")):
+    groups = {}
+    for index in range(n_players // players_per_group):
+        classe = classes[index % len(classes)]
+        grupo = index // len(classes) + 1
+        groups[(classe, grupo)] = [f"{classe}{grupo} Jogador {i}" for i in range(players_per_group)]
+    return groups
+
+def check(games, unavailable, start, weekly_target, max_per_day):
+    por_semana = ((games["Data"] - pd.Timestamp(start)).dt.days // 7).value_counts()
+    assert por_semana.max() <= weekly_target, "semana acima da meta"
+    assert not games.duplicated(["Data", "Quadra"]).any(), "quadra usada duas vezes no mesmo horário"
+    por_dia = games.assign(Dia=games["Data"].dt.date).melt(id_vars=["Dia", "Data"], value_vars=["Jogador1", "Jogador2"])
+    assert not por_dia.duplicated(["Data", "value"]).any(), "jogador com dois jogos no mesmo horário"
+    assert por_dia.groupby(["Dia", "value"]).size().max() <= max_per_day, "jogador acima do limite de jogos do dia"
+    for jogador, dias in unavailable.items():
+        assert not por_dia[(por_dia["value"] == jogador) & por_dia["Dia"].isin(dias)].shape[0], "jogador escalado em dia indisponível"
+
+def main():
+    start = date(2025, 2, 3)
+    print(f"{'jogadores':>9} {'confrontos':>10} {'semanas':>7} {'meta/sem':>8} {'gerados':>8} {'pendentes':>9} {'jogos/sem':>9} {'tempo (s)':>9}")
+    # A última liga tem meta semanal abaixo do necessário: o excedente fica pendente; a penúltima
+    # permite dois jogos por dia, em horários diferentes
+    for n_players, courts, weeks, weekly_target, max_per_day in ((96, 4, 6, 60, 1), (240, 8, 8, 120, 1),
+                                                                 (480, 12, 10, 200, 2), (960, 24, 10, 300, 1)):
+        groups = synthetic_league(n_players)
+        end = start + timedelta(days=7 * weeks - 1)
+        total = sum(len(players) * (len(players) - 1) // 2 for players in groups.values())
+        inicio = time.perf_counter()
+        unavailable = {"A1 Jogador 0": [start, start + timedelta(days=1)]}
+        games, left_over = generate_fixtures(groups, start, end, courts=courts, unavailable=unavailable,
+                                               max_per_day=max_per_day, weekly_target=weekly_target)
+        elapsed = time.perf_counter() - inicio
+        check(games, unavailable, start, weekly_target, max_per_day)
+        por_semana = ((games["Data"] - pd.Timestamp(start)).dt.days // 7).value_counts()
+        print(f"{n_players:>9} {total:>10} {weeks:>7} {weekly_target:>8} {len(games):>8} {len(left_over):>9} {por_semana.min():>4}-{por_semana.max():<4} {elapsed:>9.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# Benchmark da importação em lote dos jogos pré-cadastrados contra o laço original
+# (iterrows + strptime + varredura da agenda por jogo).
+# Uso: python -m benchmarks.bench_import
+import datetime
+import io
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic import generate_fixtures
+from importer import select_new_games
+
+# Implementação original de app.py, mantida como referência
+def legacy_new_games(pre_cadastrados, schedule):
+    def jogo_ja_existe(jogo, schedule):
+        return ((schedule["Data"] == jogo["Data"]) &
+                (schedule["Horario"] == jogo["Horario"]) &
+                (schedule["Classe"] == jogo["Classe"]) &
+                (schedule["Grupo"] == jogo["Grupo"]) &
+                (schedule["Jogador1"] == jogo["Jogador1"]) &
+                (schedule["Jogador2"] == jogo["Jogador2"])).any()
+
+    novos_jogos = []
+    for _, jogo in pre_cadastrados.iterrows():
+        horario = datetime.datetime.strptime(jogo["Horario"], "%H:%M").time()
+        data_horario = datetime.datetime.combine(jogo["Data"].date(), horario)
+        novo_jogo = {"Data": data_horario, "Horario": jogo["Horario"], "Classe": jogo["Classe"], "Grupo": jogo["Grupo"], "Jogador1": jogo["Jogador1"], "Jogador2": jogo["Jogador2"]}
+        if not jogo_ja_existe(novo_jogo, schedule):
+            novos_jogos.append(novo_jogo)
+    return pd.DataFrame(novos_jogos)
+
+def main():
+    print(f"{'jogos':>7} {'agenda':>7} {'laço (s)':>10} {'lote (s)':>10} {'novos':>7}")
+    for n in (500, 2000, 5000):
+        csv = generate_fixtures(n).to_csv(index=False)
+        fixtures = pd.read_csv(io.StringIO(csv), parse_dates=["Data"])
+        # Metade dos jogos já está na agenda
+        schedule = select_new_games(fixtures.iloc[: n // 2], fixtures.iloc[:0])
+
+        inicio = time.perf_counter()
+        legacy = legacy_new_games(fixtures, schedule)
+        t_legacy = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        bulk = select_new_games(fixtures, schedule)
+        t_bulk = time.perf_counter() - inicio
+
+        assert len(bulk) == len(legacy.drop_duplicates())
+        print(f"{n:>7} {len(schedule):>7} {t_legacy:>10.3f} {t_bulk:>10.4f} {len(bulk):>7}")
+
+if __name__ == "__main__":
+    main()
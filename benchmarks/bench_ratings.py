@@ -0,0 +1,40 @@
+# Benchmark do ranking Elo: recálculo completo e atualização incremental por resultado.
+# Uso: python -m benchmarks.bench_ratings
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import generate_results
+from ratings import RatingEngine
+
+def main():
+    print(f"{'resultados':>10} {'jogadores':>10} {'recálculo (s)':>14} {'por resultado (µs)':>19}")
+    for n in (1000, 10000, 100000):
+        results = generate_results(n, players_per_group=16)
+        engine = RatingEngine()
+        inicio = time.perf_counter()
+        engine.rebuild(results, "completo")
+        t_full = time.perf_counter() - inicio
+        print(f"{n:>10} {len(engine.names):>10} {t_full:>14.4f} {t_full / n * 1e6:>19.2f}")
+
+    # Atualização incremental (um resultado por gravação, em ordem de data) deve chegar ao mesmo ranking
+    results = generate_results(2000, players_per_group=16).sort_values(by="Data", kind="stable").reset_index(drop=True)
+    full = RatingEngine()
+    full.rebuild(results, "completo")
+    incremental = RatingEngine()
+    incremental.rebuild(results.iloc[:1000], 0)
+    inicio = time.perf_counter()
+    for i in range(1000, len(results)):
+        incremental.apply(results.iloc[i:i + 1], i - 1000, i - 999)
+    t_apply = (time.perf_counter() - inicio) / 1000
+    assert incremental.signature == 1000
+    assert incremental.names == full.names
+    assert np.allclose(incremental.ratings, full.ratings)
+    print(f"apply incremental (inclui o DataFrame de uma linha): {t_apply * 1e6:.1f} µs por resultado")
+
+    # Resultado fora de ordem invalida o ranking para recálculo
+    incremental.apply(results.iloc[:1], 1000, 1001)
+    assert incremental.signature is None
+
+if __name__ == "__main__":
+    main()
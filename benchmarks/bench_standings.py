@@ -0,0 +1,67 @@
+# Benchmark da classificação vetorizada contra o laço original com iterrows.
+# Uso: python -m benchmarks.bench_standings
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic import generate_results
+from standings import compute_all_standings
+
+# Implementação original de app.py (laço por linha), mantida como referência
+def legacy_group_stats(results, group):
+    stats = {}
+    for _, row in results[results["Grupo"] == group].iterrows():
+        jogador1 = row["Jogador1"]
+        jogador2 = row["Jogador2"]
+        for jogador in (jogador1, jogador2):
+            if jogador not in stats:
+                stats[jogador] = {"Jogos": 0, "Vitórias": 0, "Derrotas": 0, "Sets_Ganhos": 0, "Sets_Perdidos": 0, "Games_Ganhos": 0, "Games_Perdidos": 0, "Tiebreaks_Ganhos": 0, "Tiebreaks_Perdidos": 0}
+        stats[jogador1]["Jogos"] += 1
+        stats[jogador2]["Jogos"] += 1
+        if row["Vencedor"] == jogador1:
+            stats[jogador1]["Vitórias"] += 1
+            stats[jogador2]["Derrotas"] += 1
+        else:
+            stats[jogador2]["Vitórias"] += 1
+            stats[jogador1]["Derrotas"] += 1
+        for nome in ("Sets", "Games", "Tiebreaks"):
+            stats[jogador1][f"{nome}_Ganhos"] += row[f"{nome}_Jogador1"]
+            stats[jogador1][f"{nome}_Perdidos"] += row[f"{nome}_Jogador2"]
+            stats[jogador2][f"{nome}_Ganhos"] += row[f"{nome}_Jogador2"]
+            stats[jogador2][f"{nome}_Perdidos"] += row[f"{nome}_Jogador1"]
+    stats_df = pd.DataFrame.from_dict(stats, orient="index")
+    stats_df["Saldo_Sets"] = stats_df["Sets_Ganhos"] - stats_df["Sets_Perdidos"]
+    stats_df["Saldo_Games"] = stats_df["Games_Ganhos"] - stats_df["Games_Perdidos"]
+    stats_df["Saldo_Tiebreaks"] = stats_df["Tiebreaks_Ganhos"] - stats_df["Tiebreaks_Perdidos"]
+    return stats_df.sort_values(by=["Vitórias", "Saldo_Sets", "Saldo_Games", "Saldo_Tiebreaks"], ascending=False)
+
+# Todas as tabelas com o laço original (um grupo por classe de cada vez)
+def legacy_all_standings(results):
+    tables = {}
+    for classe in results["Classe"].unique():
+        subset = results[results["Classe"] == classe]
+        for grupo in subset["Grupo"].unique():
+            tables[(classe, grupo)] = legacy_group_stats(subset, grupo)
+    return tables
+
+def timed(func, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        inicio = time.perf_counter()
+        output = func(*args)
+        best = min(best, time.perf_counter() - inicio)
+    return best, output
+
+def main():
+    print(f"{'resultados':>10} {'laço (s)':>10} {'vetorizado (s)':>15} {'ganho':>8}")
+    for n in (500, 2000, 10000):
+        results = generate_results(n)
+        t_legacy, legacy = timed(legacy_all_standings, results)
+        t_vector, vector = timed(compute_all_standings, results)
+        assert legacy.keys() == vector.keys()
+        for key in legacy:
+            pd.testing.assert_frame_equal(legacy[key], vector[key], check_dtype=False)
+        print(f"{n:>10} {t_legacy:>10.4f} {t_vector:>15.4f} {t_legacy / t_vector:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# Benchmark da leitura dos resultados: CSV (com reinterpretação das datas) contra o snapshot Parquet com categóricas.
+# Cada formato é medido em um processo novo para que o RSS de um não afete o outro.
+# Uso: python -m benchmarks.bench_storage [n_resultados]
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.synthetic import generate_results
+from storage import RESULT_COLUMNS, Journal, ParquetJournal
+
+# Função para obter a memória residente do processo (Linux: /proc; demais: pico via resource)
+def rss_bytes():
+    try:
+        with open("/proc/self/statm") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def open_store(backend, path):
+    if backend == "parquet":
+        return ParquetJournal(path, RESULT_COLUMNS)
+    return Journal(path, RESULT_COLUMNS)
+
+# Processo filho: carrega o arquivo algumas vezes e imprime tempo, RSS e memória do DataFrame
+def child(backend, path, warmup_path, repeat=3):
+    # Uma leitura pequena antes da medição inicializa bibliotecas e pools de threads
+    open_store(backend, warmup_path).load()
+    store = open_store(backend, path)
+    # RSS medido na primeira leitura; o tempo é o melhor de algumas leituras
+    before = rss_bytes()
+    inicio = time.perf_counter()
+    frame = store.load()
+    best = time.perf_counter() - inicio
+    rss = rss_bytes() - before
+    for _ in range(repeat - 1):
+        store.evict()
+        inicio = time.perf_counter()
+        frame = store.load()
+        best = min(best, time.perf_counter() - inicio)
+    print(best, rss, frame.memory_usage(deep=True).sum(), len(frame))
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as pasta:
+        results = generate_results(n, players_per_group=16)
+        files = {"csv": os.path.join(pasta, "resultados.csv"), "parquet": os.path.join(pasta, "resultados.parquet")}
+        for backend, path in files.items():
+            open_store(backend, path).replace(results)
+            open_store(backend, path + ".warmup").replace(results.iloc[:100])
+
+        print(f"{n} resultados")
+        print(f"{'formato':>8} {'arquivo (MB)':>13} {'leitura (s)':>12} {'RSS (MB)':>9} {'DataFrame (MB)':>15} {'bytes/linha':>12}")
+        for backend, path in files.items():
+            output = subprocess.run([sys.executable, "-m", "benchmarks.bench_storage", "--child", backend, path, path + ".warmup"], capture_output=True, text=True, check=True).stdout.split()
+            tempo, rss, memoria, linhas = float(output[0]), int(output[1]), int(output[2]), int(output[3])
+            assert linhas == n
+            print(f"{backend:>8} {os.path.getsize(path) / 2**20:>13.1f} {tempo:>12.4f} {rss / 2**20:>9.1f} {memoria / 2**20:>15.1f} {memoria / n:>12.0f}")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(sys.argv[2], sys.argv[3], sys.argv[4])
+    else:
+        main()
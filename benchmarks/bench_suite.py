@@ -0,0 +1,163 @@
+# Benchmark das funções centrais do app sobre ligas sintéticas de vários tamanhos,
+# com tempo (mediana de várias execuções) e pico de memória (tracemalloc) de cada etapa,
+# comparados com uma baseline gravada em benchmarks/baseline.json.
+# Uso: python -m benchmarks.bench_suite [--tamanhos pequeno,medio] [--salvar-baseline] [--tolerancia 2.0]
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import timedelta
+
+import pandas as pd
+
+from benchmarks.synthetic import generate_league, write_league
+from cache import frame_cache
+from calendar_index import build_calendar_index
+from importer import import_fixtures
+from standings import StandingsStore
+from storage import RESULT_COLUMNS, SCHEDULE_COLUMNS, Journal
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Tamanhos de liga (3 classes x 4 grupos): 8, 32 e 128 jogadores por grupo
+SIZES = {
+    "pequeno": {"n_players": 96, "weeks": 6},
+    "medio": {"n_players": 384, "weeks": 12},
+    "grande": {"n_players": 1536, "weeks": 26},
+}
+
+START = pd.Timestamp("2025-02-03")
+
+# Diferenças menores que isso (ms) não contam como regressão: nas etapas de poucos
+# milissegundos, alguns ms de ruído já passam da tolerância
+MIN_DIFF_MS = 5.0
+
+# Razão de tempo (atual / baseline) acima da qual uma etapa é apontada como regressão. Entre
+# processos, a mesma etapa varia até ~1.6x nesta máquina de uma vCPU, mesmo com a mediana
+TOLERANCE = 2.0
+
+# Função para medir a mediana dos tempos (s) e o pico de memória alocada (bytes) de uma etapa;
+# "setup" roda antes de cada execução e fica fora da medição. Como no timeit, o coletor de lixo
+# fica desligado durante a medição, para que uma coleta disparada por outra etapa não entre no tempo.
+def measure(func, setup=None, repeat=9):
+    tempos = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        gc.disable()
+        try:
+            inicio = time.perf_counter()
+            func()
+            tempos.append(time.perf_counter() - inicio)
+        finally:
+            gc.enable()
+    if setup:
+        setup()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(tempos), peak
+
+# Etapas medidas, na ordem em que o app as executa
+def stages(pasta, weeks):
+    start_date = START.date()
+    end_date = start_date + timedelta(days=weeks * 7 - 1)
+    schedule_store = Journal(os.path.join(pasta, "agendamentos.csv"), SCHEDULE_COLUMNS)
+    results = Journal(os.path.join(pasta, "resultados.csv"), RESULT_COLUMNS).load(start_date, end_date)
+    standings = StandingsStore()
+    schedule = schedule_store.load(start_date, end_date)
+    calendar = build_calendar_index(schedule, start_date, end_date)
+    import_store = Journal(os.path.join(pasta, "importados.csv"), SCHEDULE_COLUMNS)
+    pre_registered_file = os.path.join(pasta, "jogos_pre_cadastrados.csv")
+    groups = list(results[["Classe", "Grupo"]].drop_duplicates().itertuples(index=False))
+    filtros = {"start": start_date, "end": end_date, "classe": "B", "grupo": 1}
+
+    def clear_import():
+        import_store.clear()
+        frame_cache.invalidate(pre_registered_file)
+
+    def rebuild_standings():
+        standings.rebuild(results, None)
+
+    def standings_tables():
+        for classe, grupo in groups:
+            standings.table(classe, grupo)
+
+    def filter_pipeline():
+        schedule_store.count(**filtros)
+        schedule_store.query(limit=50, offset=0, **filtros)
+
+    return [
+        ("load_schedule", schedule_store.evict, lambda: schedule_store.load(start_date, end_date)),
+        ("importar pré-cadastrados", clear_import, lambda: import_fixtures(pre_registered_file, store=import_store)),
+        ("calendário (create_calendar)", None, lambda: build_calendar_index(schedule, start_date, end_date)),
+        ("metas semanais (evaluate_weekly_goal)", None, calendar.weekly),
+        ("classificação (StandingsStore.rebuild)", None, rebuild_standings),
+        ("tabelas de classificação (todos os grupos)", rebuild_standings, standings_tables),
+        ("filtros e paginação", None, filter_pipeline),
+    ]
+
+def run(sizes):
+    medicoes = {}
+    for size in sizes:
+        config = SIZES[size]
+        schedule, results = generate_league(config["n_players"], weeks=config["weeks"], start=START)
+        with tempfile.TemporaryDirectory() as pasta:
+            write_league(pasta, schedule, results)
+            medicoes[size] = {"jogos": len(schedule), "resultados": len(results), "etapas": {}}
+            for name, setup, func in stages(pasta, config["weeks"]):
+                tempo, pico = measure(func, setup)
+                medicoes[size]["etapas"][name] = {"tempo_ms": round(tempo * 1000, 3), "pico_mb": round(pico / 2**20, 3)}
+    return medicoes
+
+# Função para imprimir as medições e compará-las com a baseline; retorna as etapas que ficaram mais lentas
+def report(medicoes, baseline, tolerancia):
+    regressoes = []
+    for size, medicao in medicoes.items():
+        print(f"\n{size}: {medicao['jogos']} jogos, {medicao['resultados']} resultados")
+        print(f"{'etapa':<42} {'tempo (ms)':>11} {'pico (MB)':>10} {'baseline (ms)':>14} {'razão':>7}")
+        for name, valores in medicao["etapas"].items():
+            base = baseline.get(size, {}).get("etapas", {}).get(name)
+            if base:
+                razao = valores["tempo_ms"] / base["tempo_ms"] if base["tempo_ms"] else float("inf")
+                marca = "  <- regressão" if razao > tolerancia and valores["tempo_ms"] - base["tempo_ms"] > MIN_DIFF_MS else ""
+                if marca:
+                    regressoes.append((size, name))
+                print(f"{name:<42} {valores['tempo_ms']:>11.3f} {valores['pico_mb']:>10.3f} {base['tempo_ms']:>14.3f} {razao:>6.2f}x{marca}")
+            else:
+                print(f"{name:<42} {valores['tempo_ms']:>11.3f} {valores['pico_mb']:>10.3f} {'-':>14} {'-':>7}")
+    return regressoes
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark das funções centrais do app com ligas sintéticas.")
+    parser.add_argument("--tamanhos", default=",".join(SIZES), help=f"tamanhos separados por vírgula ({', '.join(SIZES)})")
+    parser.add_argument("--salvar-baseline", action="store_true", help="grava as medições como nova baseline")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCE, help="razão de tempo acima da qual a etapa é apontada como regressão")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+
+    medicoes = run(args.tamanhos.split(","))
+    regressoes = report(medicoes, baseline, args.tolerancia)
+    if args.salvar_baseline:
+        baseline.update(medicoes)
+        with open(BASELINE_FILE, "w", encoding="utf-8") as handle:
+            json.dump(baseline, handle, ensure_ascii=False, indent=2)
+            handle.write("\n")
+        print(f"\nBaseline gravada em {BASELINE_FILE}")
+    elif regressoes:
+        print(f"\n{len(regressoes)} etapa(s) mais lentas que a baseline (tolerância {args.tolerancia}x)")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from fixtures import DEFAULT_TIME_SLOTS
+from storage import DATE_FORMAT, SCHEDULE_COLUMNS
+
+RESULT_COLUMNS = ["Data", "Horario", "Classe", "Grupo", "Jogador1", "Jogador2", "Vencedor", "Sets_Jogador1", "Sets_Jogador2", "Games_Jogador1", "Games_Jogador2", "Tiebreaks_Jogador1", "Tiebreaks_Jogador2"]
+
+# Função para sortear placares (sets, games e tiebreaks de cada jogador) em melhor de 3 sets
+def random_scores(rng, n):
+    sets1 = rng.integers(0, 3, n)
+    sets2 = np.where(sets1 == 2, rng.integers(0, 2, n), 2)
+    games1 = sets1 * 6 + rng.integers(0, 5, n)
+    games2 = sets2 * 6 + rng.integers(0, 5, n)
+    tb1 = rng.integers(0, 2, n)
+    tb2 = rng.integers(0, 2, n)
+    return sets1, sets2, games1, games2, tb1, tb2
+
+# Função para gerar resultados sintéticos no mesmo formato de resultados.csv
+def generate_results(n_results, classes=("B", "C", "D"), groups=(1, 2, 3, 4), players_per_group=8, start=pd.Timestamp("2025-02-03"), seed=0):
+    rng = np.random.default_rng(seed)
+    classe = rng.choice(list(classes), n_results)
+    grupo = rng.choice(list(groups), n_results)
+    p1 = rng.integers(0, players_per_group, n_results)
+    p2 = (p1 + rng.integers(1, players_per_group, n_results)) % players_per_group
+    jogador1 = np.char.add(np.char.add(np.char.add(classe, grupo.astype(str)), " Jogador "), p1.astype(str))
+    jogador2 = np.char.add(np.char.add(np.char.add(classe, grupo.astype(str)), " Jogador "), p2.astype(str))
+
+    sets1, sets2, games1, games2, tb1, tb2 = random_scores(rng, n_results)
+    data = start + pd.to_timedelta(rng.integers(0, 365, n_results), unit="D") + pd.to_timedelta(rng.choice([8, 10, 16, 19], n_results), unit="h")
+
+    return pd.DataFrame({
+        "Data": data,
+        "Horario": data.strftime("%H:%M"),
+        "Classe": classe.astype(object),
+        "Grupo": grupo,
+        "Jogador1": jogador1.astype(object),
+        "Jogador2": jogador2.astype(object),
+        "Vencedor": np.where(sets1 > sets2, jogador1, jogador2).astype(object),
+        "Sets_Jogador1": sets1,
+        "Sets_Jogador2": sets2,
+        "Games_Jogador1": games1,
+        "Games_Jogador2": games2,
+        "Tiebreaks_Jogador1": tb1,
+        "Tiebreaks_Jogador2": tb2,
+    })[RESULT_COLUMNS]
+
+# Função para gerar jogos agendados sintéticos no formato de jogos_pre_cadastrados.csv
+def generate_fixtures(n_games, classes=("B", "C", "D"), groups=(1, 2, 3, 4), players_per_group=8, start=pd.Timestamp("2025-02-03"), days=42, seed=0):
+    results = generate_results(n_games, classes, groups, players_per_group, start, seed)
+    rng = np.random.default_rng(seed + 1)
+    data = start + pd.to_timedelta(rng.integers(0, days, n_games), unit="D")
+    return pd.DataFrame({
+        "Data": data.strftime("%Y-%m-%d"),
+        "Horario": results["Horario"],
+        "Classe": results["Classe"],
+        "Grupo": results["Grupo"],
+        "Jogador1": results["Jogador1"],
+        "Jogador2": results["Jogador2"],
+    })
+
+# Função para gerar uma liga completa: todos contra todos em cada classe/grupo, espalhado
+# por "weeks" semanas, com resultados para uma fração (result_density) dos jogos.
+# Os jogadores são divididos igualmente entre os grupos de todas as classes.
+def generate_league(n_players=96, classes=("B", "C", "D"), groups=(1, 2, 3, 4), weeks=6, result_density=0.5, time_slots=DEFAULT_TIME_SLOTS, start=pd.Timestamp("2025-02-03"), seed=0):
+    rng = np.random.default_rng(seed)
+    players_per_group = max(n_players // (len(classes) * len(groups)), 2)
+    first, second = np.triu_indices(players_per_group, 1)
+    blocks = []
+    for classe in classes:
+        for grupo in groups:
+            names = np.array([f"{classe}{grupo} Jogador {i}" for i in range(players_per_group)], dtype=object)
+            blocks.append((np.full(len(first), classe, dtype=object), np.full(len(first), grupo), names[first], names[second]))
+    classe, grupo, jogador1, jogador2 = (np.concatenate(column) for column in zip(*blocks))
+
+    n_games = len(classe)
+    horario = rng.choice(list(time_slots), n_games)
+    data = start + pd.to_timedelta(rng.integers(0, weeks * 7, n_games), unit="D") + pd.to_timedelta(pd.Series(horario) + ":00").to_numpy()
+    schedule = pd.DataFrame({
+        "Data": data,
+        "Horario": horario.astype(object),
+        "Classe": classe,
+        "Grupo": grupo,
+        "Jogador1": jogador1,
+        "Jogador2": jogador2,
+    })[SCHEDULE_COLUMNS].sort_values(by="Data", kind="stable").reset_index(drop=True)
+
+    played = schedule[rng.random(n_games) < result_density].reset_index(drop=True)
+    sets1, sets2, games1, games2, tb1, tb2 = random_scores(rng, len(played))
+    results = played.assign(
+        Vencedor=np.where(sets1 > sets2, played["Jogador1"], played["Jogador2"]),
+        Sets_Jogador1=sets1,
+        Sets_Jogador2=sets2,
+        Games_Jogador1=games1,
+        Games_Jogador2=games2,
+        Tiebreaks_Jogador1=tb1,
+        Tiebreaks_Jogador2=tb2,
+    )[RESULT_COLUMNS]
+    return schedule, results
+
+# Função para gravar uma liga nos arquivos do app: agendamentos.csv, resultados.csv e
+# jogos_pre_cadastrados.csv (a mesma agenda no formato de importação, com data e horário separados)
+def write_league(pasta, schedule, results):
+    os.makedirs(pasta, exist_ok=True)
+    schedule.to_csv(os.path.join(pasta, "agendamentos.csv"), index=False, date_format=DATE_FORMAT)
+    results.to_csv(os.path.join(pasta, "resultados.csv"), index=False, date_format=DATE_FORMAT)
+    pre_cadastrados = schedule.assign(Data=schedule["Data"].dt.strftime("%Y-%m-%d"))
+    pre_cadastrados.to_csv(os.path.join(pasta, "jogos_pre_cadastrados.csv"), index=False)
+
+# Geração de uma liga sintética pela linha de comando:
+#   python -m benchmarks.synthetic pasta [--jogadores N] [--semanas N] [--densidade F]
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera uma liga sintética nos arquivos do app.")
+    parser.add_argument("pasta", help="pasta de destino dos CSVs")
+    parser.add_argument("--jogadores", type=int, default=96, help="total de jogadores (divididos entre classes e grupos)")
+    parser.add_argument("--classes", default="B,C,D", help="classes separadas por vírgula")
+    parser.add_argument("--grupos", type=int, default=4, help="grupos por classe")
+    parser.add_argument("--semanas", type=int, default=6, help="duração do torneio em semanas")
+    parser.add_argument("--densidade", type=float, default=0.5, help="fração dos jogos com resultado")
+    parser.add_argument("--inicio", default="2025-02-03", help="data de início (AAAA-MM-DD)")
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    schedule, results = generate_league(
+        args.jogadores,
+        classes=tuple(args.classes.split(",")),
+        groups=tuple(range(1, args.grupos + 1)),
+        weeks=args.semanas,
+        result_density=args.densidade,
+        start=pd.Timestamp(args.inicio),
+        seed=args.semente,
+    )
+    write_league(args.pasta, schedule, results)
+    print(f"{len(schedule)} jogos e {len(results)} resultados gravados em {args.pasta}")
+
+if __name__ == "__main__":
+    main()
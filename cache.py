@@ -0,0 +1,111 @@
+import os
+import threading
+
+import pandas as pd
+
+# Os DataFrames do cache são compartilhados entre todas as sessões. Com copy-on-write
+# (sempre ativo a partir do pandas 3), qualquer alteração feita por uma sessão gera
+# uma cópia só dela e o objeto compartilhado nunca é modificado.
+if int(pd.__version__.split(".")[0]) < 3:
+    try:
+        pd.set_option("mode.copy_on_write", True)
+    except (KeyError, AttributeError):
+        pass
+
+# Função para obter a assinatura (mtime, tamanho) de um arquivo, usada para detectar alterações externas
+def file_signature(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+# Cache de DataFrames do processo, chaveado por origem e invalidado pela assinatura
+# (mtime/tamanho do arquivo, versão da tabela) da origem
+class FrameCache:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}  # chave -> (assinatura, DataFrame)
+        self.loading = {}  # chave -> trava usada enquanto a entrada é carregada
+        self.hits = 0
+        self.misses = 0
+
+    # Retorna o DataFrame da chave, carregando-o só se a assinatura mudou
+    def get(self, key, signature, loader):
+        return self.get_signed(key, signature, lambda: (loader(), signature))[0]
+
+    # Como get, mas o loader retorna o DataFrame junto com a assinatura em que ele foi lido,
+    # que pode ser mais nova que a pedida se houve uma gravação no meio; a entrada guarda
+    # essa assinatura e o retorno é (DataFrame, assinatura)
+    def get_signed(self, key, signature, loader):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                return entry[1], entry[0]
+            key_lock = self.loading.setdefault(key, threading.Lock())
+        # Sessões que pedem a mesma chave ao mesmo tempo esperam uma única leitura
+        with key_lock:
+            with self.lock:
+                entry = self.entries.get(key)
+                if entry is not None and entry[0] == signature:
+                    self.hits += 1
+                    return entry[1], entry[0]
+            frame, signature = loader()
+            with self.lock:
+                self.misses += 1
+                self.entries[key] = (signature, frame)
+            return frame, signature
+
+    # Remove as entradas de uma origem (ou todas)
+    def invalidate(self, prefix=None):
+        with self.lock:
+            for key in [key for key in self.entries if prefix is None or key[0] == prefix]:
+                del self.entries[key]
+
+    # Contadores de acertos e falhas
+    def stats(self):
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self.entries)}
+
+frame_cache = FrameCache()
+
+# Estado em memória derivado de um armazenamento (classificação, ranking, índices),
+# compartilhado entre as sessões. A assinatura do armazenamento indica se o estado
+# ainda corresponde ao que está salvo: sync só recalcula tudo se ela mudou fora do app
+# (com as linhas e a assinatura lidas juntas por "load"), e apply acrescenta as linhas
+# gravadas entre as assinaturas "before" e "after".
+# As subclasses implementam _rebuild(frame) e _apply(frame, ...), chamados com a trava.
+class SyncedState:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.signature = None
+
+    # Recalcula tudo a partir das linhas salvas
+    def rebuild(self, frame, signature):
+        with self.lock:
+            self._rebuild(frame)
+            self.signature = signature
+
+    # Garante que o estado corresponde ao armazenamento; só recalcula se ele mudou fora do app.
+    # "load" retorna (linhas, assinatura em que foram lidas): uma gravação entre a consulta
+    # da assinatura e a leitura não pode deixar o estado com linhas novas e assinatura antiga
+    def sync(self, signature, load):
+        with self.lock:
+            if self.signature is not None and self.signature == signature:
+                return
+        self.rebuild(*load())
+
+    # Aplica linhas recém-gravadas; se outra gravação aconteceu no meio (ou se _apply
+    # retornar False), o estado é invalidado e recalculado no próximo sync
+    def apply(self, frame, before, after, **options):
+        with self.lock:
+            if self.signature != before or self._apply(frame, **options) is False:
+                self.signature = None
+                return
+            self.signature = after
+
+# Função para ler um CSV usando o cache compartilhado (chave: caminho, mtime e tamanho)
+def read_csv_cached(path, **kwargs):
+    key = (path, "csv", tuple(sorted((name, repr(value)) for name, value in kwargs.items())))
+    return frame_cache.get(key, file_signature(path), lambda: pd.read_csv(path, **kwargs))
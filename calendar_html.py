@@ -0,0 +1,102 @@
+import html
+import json
+from datetime import timedelta
+from functools import lru_cache
+
+MESES = ["Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho", "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"]
+DIAS_SEMANA = ["Seg", "Ter", "Qua", "Qui", "Sex", "Sáb", "Dom"]
+
+# Altura (px) de cada semana do calendário e do restante (títulos, cabeçalho e navegação)
+ROW_HEIGHT = 66
+EXTRA_HEIGHT = 110
+
+# Cores dos dias conforme o número de jogos (as mesmas do calendário original)
+CSS = """
+body { margin: 0; font-family: "Source Sans Pro", sans-serif; color: #31333F; }
+.mes[hidden] { display: none; }
+table { width: 100%; border-collapse: separate; border-spacing: 4px; table-layout: fixed; }
+th { font-weight: 700; padding: 4px; }
+td.dia { padding: 10px 2px; border-radius: 5px; text-align: center; color: black; }
+td.livre { background-color: #BBDEFB; }
+td.poucos { background-color: #FFF59D; }
+td.muitos { background-color: #EF9A9A; }
+nav { display: flex; justify-content: space-between; align-items: center; margin-top: 8px; }
+button { padding: 6px 12px; border: 1px solid #d6d6d9; border-radius: 8px; background: white; cursor: pointer; }
+button:disabled { cursor: default; opacity: 0.4; }
+"""
+
+# Troca de mês no navegador; o mês exibido fica guardado na aba para sobreviver às reexecuções do script
+SCRIPT = """
+const meses = document.querySelectorAll(".mes");
+const chave = %s;
+let atual = %d;
+try { const salvo = sessionStorage.getItem(chave); if (salvo !== null) atual = Number(salvo); } catch (e) {}
+function mostrar(indice) {
+    atual = indice = Math.max(0, Math.min(indice, meses.length - 1));
+    meses.forEach((mes, i) => { mes.hidden = i !== indice; });
+    document.getElementById("anterior").disabled = indice === 0;
+    document.getElementById("proximo").disabled = indice === meses.length - 1;
+    document.getElementById("titulo").textContent = meses[indice].dataset.titulo;
+    try { sessionStorage.setItem(chave, indice); } catch (e) {}
+}
+document.getElementById("anterior").onclick = () => mostrar(atual - 1);
+document.getElementById("proximo").onclick = () => mostrar(atual + 1);
+mostrar(atual);
+"""
+
+# Função para obter o primeiro dia do mês seguinte (ou do anterior, com step=-1)
+def shift_month(month, step=1):
+    if step > 0:
+        return (month.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return (month.replace(day=1) - timedelta(days=1)).replace(day=1)
+
+# Função para montar a tabela de um mês; counts tem o número de jogos de cada dia do mês
+def month_grid(month, counts):
+    linhas = ["<tr>" + "".join(f"<th>{dia}</th>" for dia in DIAS_SEMANA) + "</tr>"]
+    celulas = ["<td></td>"] * month.weekday()  # alinha o primeiro dia do mês
+    for day, count in enumerate(counts, start=1):
+        classe = "livre" if count == 0 else "poucos" if count <= 2 else "muitos"
+        celulas.append(f"<td class='dia {classe}'><strong>{day}</strong><br>{count} jogo(s)</td>")
+        if len(celulas) == 7:
+            linhas.append("<tr>" + "".join(celulas) + "</tr>")
+            celulas = []
+    if celulas:
+        linhas.append("<tr>" + "".join(celulas) + "</tr>")
+    return "<table>" + "".join(linhas) + "</table>", len(linhas) - 1
+
+# Documento HTML com todos os meses, guardado em cache pelo conteúdo (meses e contagens diárias)
+@lru_cache(maxsize=32)
+def render_calendar(months, initial, key):
+    secoes = []
+    max_rows = 0
+    for month, counts in months:
+        tabela, rows = month_grid(month, counts)
+        max_rows = max(max_rows, rows)
+        titulo = html.escape(f"{MESES[month.month - 1]} {month.year}")
+        secoes.append(f"<section class='mes' data-titulo='{titulo}' hidden>{tabela}</section>")
+    documento = (
+        f"<style>{CSS}</style>"
+        + "".join(secoes)
+        + "<nav><button id='anterior'>Mês Anterior</button><strong id='titulo'></strong><button id='proximo'>Próximo Mês</button></nav>"
+        + f"<script>{SCRIPT % (json.dumps(key), initial)}</script>"
+    )
+    return documento, max_rows * ROW_HEIGHT + EXTRA_HEIGHT
+
+# Função para gerar o calendário do torneio em um único HTML. Além dos meses do torneio,
+# o mês anterior e o seguinte já vão no mesmo documento, então a navegação entre
+# meses é feita no navegador, sem reexecutar o script.
+def calendar_html(calendar, current_month, key=""):
+    current_month = current_month.replace(day=1)
+    first = shift_month(min(calendar.start_date.replace(day=1), current_month), -1)
+    last = shift_month(max(calendar.end_date.replace(day=1), current_month))
+    counts = calendar.counts(first, shift_month(last) - timedelta(days=1)).tolist()
+
+    months = []
+    month, offset = first, 0
+    while month <= last:
+        n_days = (shift_month(month) - month).days
+        months.append((month, tuple(counts[offset:offset + n_days])))
+        offset += n_days
+        month = shift_month(month)
+    initial = next(i for i, (month, _) in enumerate(months) if month == current_month)
+    return render_calendar(tuple(months), initial, key)
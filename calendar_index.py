@@ -0,0 +1,68 @@
+import threading
+from collections import OrderedDict
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+# Contagem de jogos por dia e por semana do torneio, calculada uma única vez por agenda
+class CalendarIndex:
+    def __init__(self, start_date, end_date, daily):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.daily = daily  # array com o número de jogos de cada dia, a partir de start_date
+
+    # Número de jogos de um dia (mesma interface do dicionário usado antes)
+    def get(self, day, default=0):
+        offset = (day - self.start_date).days
+        if 0 <= offset < len(self.daily):
+            return int(self.daily[offset])
+        return default
+
+    # Números de jogos de cada dia entre first e last (inclusive); dias fora do torneio contam zero
+    def counts(self, first, last):
+        n_days = (last - first).days + 1
+        offset = (first - self.start_date).days
+        counts = np.zeros(n_days, dtype="int64")
+        begin, end = max(offset, 0), min(offset + n_days, len(self.daily))
+        if begin < end:
+            counts[begin - offset:end - offset] = self.daily[begin:end]
+        return counts
+
+    # Jogos por semana; as semanas começam em start_date e têm 7 dias (a última pode ser menor)
+    def weekly(self):
+        n_weeks = -(-len(self.daily) // 7)
+        padded = np.zeros(n_weeks * 7, dtype="int64")
+        padded[:len(self.daily)] = self.daily
+        totals = padded.reshape(n_weeks, 7).sum(axis=1)
+        return {self.start_date + timedelta(days=7 * i): int(total) for i, total in enumerate(totals)}
+
+# Função para montar o índice com um único bincount sobre as datas da agenda
+def build_calendar_index(schedule, start_date, end_date):
+    n_days = (end_date - start_date).days + 1
+    if schedule.empty:
+        return CalendarIndex(start_date, end_date, np.zeros(n_days, dtype="int64"))
+    offsets = (pd.to_datetime(schedule["Data"]).dt.normalize() - pd.Timestamp(start_date)).dt.days.to_numpy()
+    offsets = offsets[(offsets >= 0) & (offsets < n_days)]
+    return CalendarIndex(start_date, end_date, np.bincount(offsets.astype("int64"), minlength=n_days))
+
+# As agendas nunca são alteradas no lugar (cada gravação gera um novo DataFrame),
+# então o próprio objeto serve de chave. A referência guardada impede que o id seja reutilizado.
+_index_lock = threading.Lock()
+_index_cache = OrderedDict()  # (id(schedule), start, end) -> (schedule, CalendarIndex)
+MAX_CACHED_INDEXES = 16
+
+# Função para obter o índice da agenda, recalculando só quando a agenda muda
+def calendar_index(schedule, start_date, end_date):
+    key = (id(schedule), start_date, end_date)
+    with _index_lock:
+        entry = _index_cache.get(key)
+        if entry is not None and entry[0] is schedule:
+            _index_cache.move_to_end(key)
+            return entry[1]
+    index = build_calendar_index(schedule, start_date, end_date)
+    with _index_lock:
+        _index_cache[key] = (schedule, index)
+        while len(_index_cache) > MAX_CACHED_INDEXES:
+            _index_cache.popitem(last=False)
+    return index
@@ -0,0 +1,79 @@
+import pandas as pd
+
+from cache import SyncedState
+from storage import SCHEDULE_COLUMNS
+
+# Índice de ocupação da agenda: jogos por (jogador, horário), por (jogador, dia) e por
+# horário (data e hora). Um jogador não pode ter dois jogos no mesmo horário, um horário
+# comporta no máximo "courts" jogos e, se "max_per_day" for informado, cada jogador joga
+# no máximo esse número de jogos por dia. O índice é montado uma vez a partir da agenda
+# salva e atualizado a cada inclusão/exclusão.
+class ConflictIndex(SyncedState):
+    def __init__(self, courts=1, max_per_day=None):
+        super().__init__()
+        self.courts = courts
+        self.max_per_day = max_per_day
+        self.by_player_slot = {}  # (jogador, data e hora) -> jogos
+        self.by_player_day = {}   # (jogador, dia) -> jogos
+        self.by_slot = {}         # data e hora -> jogos
+
+    # Recalcula o índice com contagens vetorizadas sobre a agenda
+    def _rebuild(self, schedule):
+        self.by_player_slot, self.by_player_day, self.by_slot = {}, {}, {}
+        if not schedule.empty:
+            datas = pd.to_datetime(schedule["Data"])
+            jogadores = pd.concat([schedule["Jogador1"], schedule["Jogador2"]], ignore_index=True)
+            horarios = pd.concat([datas, datas], ignore_index=True)
+            # Com colunas categóricas o value_counts também lista combinações sem jogos
+            for name, chave in (("by_player_slot", horarios), ("by_player_day", horarios.dt.normalize())):
+                counts = pd.DataFrame({"Jogador": jogadores, "Chave": chave}).value_counts()
+                setattr(self, name, counts[counts > 0].to_dict())
+            self.by_slot = datas.value_counts().to_dict()
+
+    # Registra jogos incluídos (ou excluídos, com step=-1)
+    def _apply(self, games, step=1):
+        for data, jogador1, jogador2 in games[["Data", "Jogador1", "Jogador2"]].itertuples(index=False):
+            slot = pd.Timestamp(data)
+            dia = slot.normalize()
+            for key, counts in (((jogador1, slot), self.by_player_slot), ((jogador2, slot), self.by_player_slot),
+                                ((jogador1, dia), self.by_player_day), ((jogador2, dia), self.by_player_day),
+                                (slot, self.by_slot)):
+                counts[key] = counts.get(key, 0) + step
+                if counts[key] <= 0:
+                    del counts[key]
+
+    # Conflitos de um jogo com a agenda; "extra" tem as contagens (por jogador e horário, por
+    # jogador e dia e por horário) de um lote ainda não gravado
+    def _conflicts(self, slot, jogadores, extra=None):
+        dia = slot.normalize()
+        player_slot, player_day, by_slot = extra or ({}, {}, {})
+        conflitos = []
+        for jogador in jogadores:
+            if self.by_player_slot.get((jogador, slot), 0) + player_slot.get((jogador, slot), 0) > 0:
+                conflitos.append(f"{jogador} já tem jogo em {slot.strftime('%d/%m/%Y %H:%M')}")
+            elif self.max_per_day and self.by_player_day.get((jogador, dia), 0) + player_day.get((jogador, dia), 0) >= self.max_per_day:
+                conflitos.append(f"{jogador} já tem {self.max_per_day} jogo(s) em {dia.strftime('%d/%m/%Y')}")
+        if self.by_slot.get(slot, 0) + by_slot.get(slot, 0) >= self.courts:
+            conflitos.append(f"horário {slot.strftime('%d/%m/%Y %H:%M')} sem quadra livre")
+        return conflitos
+
+    # Conflitos de um jogo com a agenda, em O(1)
+    def check(self, game):
+        with self.lock:
+            return self._conflicts(pd.Timestamp(game["Data"]), (game["Jogador1"], game["Jogador2"]))
+
+    # Conflitos de uma lista de jogos (importação em lote) com a agenda e entre si, em uma única passada
+    def report(self, games):
+        extra = ({}, {}, {})
+        linhas = []
+        with self.lock:
+            for game in games[SCHEDULE_COLUMNS].itertuples(index=False):
+                slot = pd.Timestamp(game.Data)
+                dia = slot.normalize()
+                conflitos = self._conflicts(slot, (game.Jogador1, game.Jogador2), extra)
+                for key, counts in (((game.Jogador1, slot), extra[0]), ((game.Jogador2, slot), extra[0]),
+                                    ((game.Jogador1, dia), extra[1]), ((game.Jogador2, dia), extra[1]), (slot, extra[2])):
+                    counts[key] = counts.get(key, 0) + 1
+                if conflitos:
+                    linhas.append(game._asdict() | {"Conflito": "; ".join(conflitos)})
+        return pd.DataFrame(linhas, columns=SCHEDULE_COLUMNS + ["Conflito"])
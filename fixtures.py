@@ -0,0 +1,142 @@
+import heapq
+from datetime import timedelta
+
+import pandas as pd
+
+from storage import SCHEDULE_COLUMNS
+
+# Horários padrão de jogo em cada dia e número padrão de quadras
+DEFAULT_TIME_SLOTS = ["08:00", "10:00", "16:00", "19:00"]
+DEFAULT_COURTS = 2
+
+# Número padrão de jogos de um jogador por dia na geração automática
+DEFAULT_MAX_PER_DAY = 1
+
+# Função para obter os jogadores de cada classe/grupo a partir dos jogos já agendados
+def players_by_group(schedule):
+    groups = {}
+    if schedule.empty:
+        return groups
+    for classe, grupo, jogador1, jogador2 in schedule[["Classe", "Grupo", "Jogador1", "Jogador2"]].itertuples(index=False):
+        players = groups.setdefault((classe, int(grupo)), {})
+        players.setdefault(jogador1, None)
+        players.setdefault(jogador2, None)
+    return {key: list(players) for key, players in groups.items()}
+
+# Função para gerar as rodadas de um todos contra todos (método do círculo)
+def round_robin_rounds(players):
+    players = list(players)
+    if len(players) % 2:
+        players.append(None)  # folga
+    n = len(players)
+    rounds = []
+    for _ in range(n - 1):
+        rounds.append([(players[i], players[n - 1 - i]) for i in range(n // 2) if players[i] is not None and players[n - 1 - i] is not None])
+        # O primeiro jogador fica fixo e os demais giram
+        players = [players[0], players[-1]] + players[1:-1]
+    return rounds
+
+# Função para distribuir os jogos novos entre as semanas, completando primeiro as semanas com menos jogos;
+# com weekly_target, nenhuma semana passa da meta e os jogos que sobrarem ficam sem cota
+def weekly_quotas(existing_per_week, n_games, weekly_target=None):
+    quotas = [0] * len(existing_per_week)
+    heap = [(count, week) for week, count in enumerate(existing_per_week) if weekly_target is None or count < weekly_target]
+    heapq.heapify(heap)
+    for _ in range(n_games):
+        if not heap:
+            break
+        count, week = heapq.heappop(heap)
+        quotas[week] += 1
+        if weekly_target is None or count + 1 < weekly_target:
+            heapq.heappush(heap, (count + 1, week))
+    return quotas
+
+# Função para retirar da fila o primeiro confronto cujos jogadores estão livres no horário,
+# abaixo do limite de jogos do dia e disponíveis no dia
+def _take_playable(pending, day, horario, busy, in_slot, unavailable, max_per_day):
+    for index, (classe, grupo, jogador1, jogador2) in enumerate(pending):
+        if (busy.get((jogador1, day), 0) < max_per_day and busy.get((jogador2, day), 0) < max_per_day
+                and (jogador1, day, horario) not in in_slot and (jogador2, day, horario) not in in_slot
+                and day not in unavailable.get(jogador1, ()) and day not in unavailable.get(jogador2, ())):
+            return pending.pop(index)
+    return None
+
+# Gera os jogos que faltam para completar o todos contra todos de cada grupo.
+#   groups: {(Classe, Grupo): [jogadores]}
+#   time_slots/courts: horários diários e quadras disponíveis em cada horário
+#   unavailable: {jogador: [datas]} dias em que o jogador não pode jogar
+#   existing: agenda atual (os confrontos já marcados não são repetidos e ocupam quadras e jogadores)
+#   weekly_target: meta de jogos por semana (contando os já agendados); nenhuma semana passa dela
+# Cada jogador joga no máximo max_per_day jogos por dia e nunca dois no mesmo horário, e nenhuma quadra
+# recebe dois jogos no mesmo horário.
+# Retorna (jogos gerados com a coluna Quadra, confrontos que não couberam no período ou nas metas semanais).
+def generate_fixtures(groups, start_date, end_date, time_slots=DEFAULT_TIME_SLOTS, courts=DEFAULT_COURTS, unavailable=None, existing=None, max_per_day=DEFAULT_MAX_PER_DAY, weekly_target=None):
+    unavailable = {player: {pd.Timestamp(day).date() for day in days} for player, days in (unavailable or {}).items()}
+    n_days = (end_date - start_date).days + 1
+    n_weeks = -(-n_days // 7)
+    times = sorted(time_slots)
+
+    # Ocupação deixada pela agenda atual
+    scheduled_pairs = set()
+    busy = {}           # (jogador, dia) -> jogos no dia
+    in_slot = set()     # (jogador, dia, horário) já ocupados
+    slot_used = {}      # (dia, horário) -> quadras ocupadas
+    existing_per_week = [0] * n_weeks
+    if existing is not None and not existing.empty:
+        for data, horario, classe, grupo, jogador1, jogador2 in existing[SCHEDULE_COLUMNS].itertuples(index=False):
+            day = data.date()
+            scheduled_pairs.add((classe, int(grupo), frozenset((jogador1, jogador2))))
+            busy[(jogador1, day)] = busy.get((jogador1, day), 0) + 1
+            busy[(jogador2, day)] = busy.get((jogador2, day), 0) + 1
+            in_slot.update(((jogador1, day, horario), (jogador2, day, horario)))
+            slot_used[(day, horario)] = slot_used.get((day, horario), 0) + 1
+            offset = (day - start_date).days
+            if 0 <= offset < n_days:
+                existing_per_week[offset // 7] += 1
+
+    # Confrontos pendentes, rodada a rodada, intercalando os grupos para que todos avancem juntos
+    rounds_by_group = {key: round_robin_rounds(players) for key, players in groups.items()}
+    pending = []
+    for round_number in range(max((len(rounds) for rounds in rounds_by_group.values()), default=0)):
+        for (classe, grupo), rounds in rounds_by_group.items():
+            if round_number < len(rounds):
+                for jogador1, jogador2 in rounds[round_number]:
+                    if (classe, int(grupo), frozenset((jogador1, jogador2))) not in scheduled_pairs:
+                        pending.append((classe, grupo, jogador1, jogador2))
+
+    quotas = weekly_quotas(existing_per_week, len(pending), weekly_target)
+    generated = []
+    carry = 0  # cota não cumprida em uma semana passa para a seguinte
+    for week in range(n_weeks):
+        remaining = quotas[week] + carry
+        if weekly_target is not None:
+            remaining = min(remaining, weekly_target - existing_per_week[week])
+        week_days = [start_date + timedelta(days=offset) for offset in range(week * 7, min(week * 7 + 7, n_days))]
+        for position, day in enumerate(week_days):
+            if not pending or remaining <= 0:
+                break
+            # Espalha a cota da semana pelos dias restantes
+            day_target = -(-remaining // (len(week_days) - position))
+            placed = 0
+            for horario in times:
+                free_courts = courts - slot_used.get((day, horario), 0)
+                while free_courts > 0 and placed < day_target:
+                    game = _take_playable(pending, day, horario, busy, in_slot, unavailable, max_per_day)
+                    if game is None:
+                        break  # ninguém mais pode jogar neste horário
+                    classe, grupo, jogador1, jogador2 = game
+                    busy[(jogador1, day)] = busy.get((jogador1, day), 0) + 1
+                    busy[(jogador2, day)] = busy.get((jogador2, day), 0) + 1
+                    in_slot.update(((jogador1, day, horario), (jogador2, day, horario)))
+                    slot_used[(day, horario)] = slot_used.get((day, horario), 0) + 1
+                    generated.append((pd.Timestamp(f"{day} {horario}"), horario, classe, grupo, jogador1, jogador2, slot_used[(day, horario)]))
+                    free_courts -= 1
+                    placed += 1
+                if placed >= day_target:
+                    break
+            remaining -= placed
+        carry = max(remaining, 0)
+
+    games = pd.DataFrame(generated, columns=SCHEDULE_COLUMNS + ["Quadra"])
+    left_over = pd.DataFrame(pending, columns=["Classe", "Grupo", "Jogador1", "Jogador2"])
+    return games, left_over
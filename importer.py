@@ -0,0 +1,100 @@
+import argparse
+import sys
+import time
+
+import pandas as pd
+
+from cache import read_csv_cached
+from conflicts import ConflictIndex
+from fixtures import DEFAULT_COURTS
+from storage import SCHEDULE_COLUMNS, open_stores
+
+# Arquivo padrão com os jogos pré-cadastrados
+PRE_REGISTERED_FILE = "jogos_pre_cadastrados.csv"
+
+# Função para gerar uma chave (hash de 64 bits) por jogo, com os tipos normalizados
+def game_keys(games):
+    normalized = pd.DataFrame({
+        "Data": pd.to_datetime(games["Data"]).astype("datetime64[ns]").astype("int64"),
+        "Horario": games["Horario"].astype(str),
+        "Classe": games["Classe"].astype(str),
+        "Grupo": pd.to_numeric(games["Grupo"]).astype("int64"),
+        "Jogador1": games["Jogador1"].astype(str),
+        "Jogador2": games["Jogador2"].astype(str),
+    })
+    return pd.util.hash_pandas_object(normalized, index=False)
+
+# Função para combinar data e horário de todos os jogos em um único passo
+def prepare_games(fixtures):
+    games = fixtures[SCHEDULE_COLUMNS].copy()
+    horario = fixtures["Horario"].astype(str)
+    games["Data"] = pd.to_datetime(fixtures["Data"]).dt.normalize() + pd.to_timedelta(horario + ":00")
+    games["Horario"] = horario
+    return games
+
+# Função para selecionar os jogos que ainda não estão na agenda (anti-join pelas chaves)
+def select_new_games(fixtures, schedule):
+    games = prepare_games(fixtures)
+    keys = game_keys(games)
+    novos = ~keys.duplicated()
+    if not schedule.empty:
+        novos &= ~keys.isin(game_keys(schedule))
+    return games[novos.to_numpy()].reset_index(drop=True)
+
+# Função para obter o período (primeiro e último dia) coberto por um arquivo de jogos
+def fixture_window(fixtures):
+    datas = pd.to_datetime(fixtures["Data"])
+    if datas.empty:
+        return None
+    return datas.min().date(), datas.max().date()
+
+# Função para importar um arquivo de jogos pré-cadastrados para a agenda salva
+# (a padrão ou a de um torneio, quando "store" é informado); só a parte da agenda
+# no período do arquivo é lida para o anti-join
+def import_fixtures(path=PRE_REGISTERED_FILE, dry_run=False, store=None):
+    if store is None:
+        store, _ = open_stores()
+    fixtures = read_csv_cached(path, parse_dates=["Data"])
+    window = fixture_window(fixtures)
+    if window is None:
+        return prepare_games(fixtures)
+    novos_jogos = select_new_games(fixtures, store.load(*window))
+    if not novos_jogos.empty and not dry_run:
+        store.append(novos_jogos)
+    return novos_jogos
+
+# Importação em lote pela linha de comando:
+#   python importer.py jogos_pre_cadastrados.csv [--dry-run] [--torneio ID]
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Importa jogos pré-cadastrados para a agenda.")
+    parser.add_argument("arquivos", nargs="*", default=[PRE_REGISTERED_FILE], help="CSVs com Data, Horario, Classe, Grupo, Jogador1 e Jogador2")
+    parser.add_argument("--dry-run", action="store_true", help="apenas conta os jogos novos, sem gravar")
+    parser.add_argument("--torneio", help="id do torneio em torneios.json (padrão: a agenda agendamentos.csv)")
+    args = parser.parse_args(argv)
+
+    store, _ = open_stores()
+    courts, max_per_day = DEFAULT_COURTS, None
+    if args.torneio:
+        from tournaments import TournamentRegistry
+        registry = TournamentRegistry()
+        store = registry.data(args.torneio).schedule_store
+        courts = registry.get(args.torneio).quadras
+        max_per_day = registry.get(args.torneio).max_jogos_dia
+
+    for path in args.arquivos:
+        inicio = time.perf_counter()
+        # Os conflitos só podem acontecer nos dias do arquivo
+        window = fixture_window(read_csv_cached(path, parse_dates=["Data"]))
+        conflicts = ConflictIndex(courts, max_per_day)
+        conflicts.rebuild(*store.load_signed(*(window or ())))
+        novos_jogos = import_fixtures(path, dry_run=args.dry_run, store=store)
+        relatorio = conflicts.report(novos_jogos)
+        acao = "novos (não gravados)" if args.dry_run else "importados"
+        print(f"{path}: {len(novos_jogos)} jogos {acao} em {time.perf_counter() - inicio:.3f}s")
+        if not relatorio.empty:
+            print(f"{len(relatorio)} jogo(s) com conflito de agenda:")
+            print(relatorio.to_string(index=False))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+import bisect
+
+import numpy as np
+import pandas as pd
+
+from cache import SyncedState
+
+# Quantidade de jogos exibidos na forma recente do jogador
+RECENT_MATCHES = 5
+
+# Colunas dos totais acumulados de cada jogador
+TOTAL_COLUMNS = ["Jogos", "Vitórias", "Derrotas", "Empates", "Sets_Ganhos", "Sets_Perdidos", "Games_Ganhos", "Games_Perdidos"]
+
+# Índice de jogadores montado uma vez a partir dos resultados: para cada jogador,
+# os deslocamentos (posições) dos seus jogos em ordem de data e os totais acumulados;
+# e uma matriz simétrica de confrontos diretos (jogos e vitórias de cada par).
+# Cada resultado salvo atualiza o índice sem reler o histórico, e o perfil de um
+# jogador é montado sem percorrer os resultados.
+class PlayerIndex(SyncedState):
+    def __init__(self):
+        super().__init__()
+        self.reset()
+
+    def reset(self):
+        self.ids = {}                    # jogador -> id
+        self.names = []                  # id -> jogador
+        self.matches = []                # deslocamento -> (Jogador1, Jogador2, Vencedor, Sets1, Sets2, Games1, Games2)
+        self.dates = []                  # deslocamento -> data
+        self.offsets = []                # id -> deslocamentos dos jogos do jogador, em ordem de data
+        self.totals = np.zeros((0, len(TOTAL_COLUMNS)), dtype="int64")
+        self.h2h_games = np.zeros((0, 0), dtype="int32")  # [i, j] = jogos entre i e j (simétrica)
+        self.h2h_wins = np.zeros((0, 0), dtype="int32")   # [i, j] = vitórias de i sobre j
+
+    # Aumenta a capacidade dos arrays (dobrando) para caber n jogadores
+    def _reserve(self, n):
+        capacity = len(self.totals)
+        if n <= capacity:
+            return
+        capacity = max(n, 2 * capacity, 16)
+        totals = np.zeros((capacity, len(TOTAL_COLUMNS)), dtype="int64")
+        totals[:len(self.totals)] = self.totals
+        self.totals = totals
+        for name in ("h2h_games", "h2h_wins"):
+            old = getattr(self, name)
+            new = np.zeros((capacity, capacity), dtype="int32")
+            new[:len(old), :len(old)] = old
+            setattr(self, name, new)
+
+    def _id(self, player):
+        player_id = self.ids.get(player)
+        if player_id is None:
+            player_id = len(self.names)
+            self.ids[player] = player_id
+            self.names.append(player)
+            self.offsets.append([])
+        return player_id
+
+    # Acrescenta um lote de resultados ao índice, com contagens vetorizadas
+    def _apply(self, results):
+        if results.empty:
+            return
+        def numbers(col):
+            return pd.to_numeric(results[col], errors="coerce").fillna(0).astype("int64").to_numpy()
+
+        first = len(self.matches)
+        n = len(results)
+        jogadores1 = results["Jogador1"].tolist()
+        jogadores2 = results["Jogador2"].tolist()
+        vencedores = results["Vencedor"].tolist()
+        sets1, sets2 = numbers("Sets_Jogador1"), numbers("Sets_Jogador2")
+        games1, games2 = numbers("Games_Jogador1"), numbers("Games_Jogador2")
+        dates = pd.to_datetime(results["Data"]).tolist()
+
+        id1 = np.array([self._id(jogador) for jogador in jogadores1], dtype="int64")
+        id2 = np.array([self._id(jogador) for jogador in jogadores2], dtype="int64")
+        self._reserve(len(self.names))
+        self.matches.extend(zip(jogadores1, jogadores2, vencedores, sets1.tolist(), sets2.tolist(), games1.tolist(), games2.tolist()))
+        self.dates.extend(dates)
+
+        vitoria1 = np.array([vencedor == jogador for vencedor, jogador in zip(vencedores, jogadores1)], dtype=bool)
+        vitoria2 = np.array([vencedor == jogador for vencedor, jogador in zip(vencedores, jogadores2)], dtype=bool)
+        empate = ~(vitoria1 | vitoria2)
+
+        # Totais de cada jogador, nas duas posições do jogo
+        for ids, vitorias, derrotas, sets_ganhos, sets_perdidos, games_ganhos, games_perdidos in (
+                (id1, vitoria1, vitoria2, sets1, sets2, games1, games2),
+                (id2, vitoria2, vitoria1, sets2, sets1, games2, games1)):
+            deltas = np.column_stack([np.ones(n, dtype="int64"), vitorias, derrotas, empate, sets_ganhos, sets_perdidos, games_ganhos, games_perdidos])
+            np.add.at(self.totals, ids, deltas)
+
+        # Confrontos diretos
+        np.add.at(self.h2h_games, (id1, id2), 1)
+        np.add.at(self.h2h_games, (id2, id1), 1)
+        np.add.at(self.h2h_wins, (id1[vitoria1], id2[vitoria1]), 1)
+        np.add.at(self.h2h_wins, (id2[vitoria2], id1[vitoria2]), 1)
+
+        # Deslocamentos por jogador, em ordem de data; um lote posterior aos jogos já
+        # indexados só estende as listas, os demais são inseridos na posição certa
+        ids = np.concatenate([id1, id2])
+        offsets = np.tile(np.arange(first, first + n), 2)
+        order = np.lexsort((offsets, np.tile(pd.to_datetime(results["Data"]).to_numpy(), 2), ids))
+        ids, offsets = ids[order], offsets[order]
+        bounds = np.flatnonzero(np.diff(ids)) + 1
+        for group_ids, group_offsets in zip(np.split(ids, bounds), np.split(offsets, bounds)):
+            lista = self.offsets[group_ids[0]]
+            novos = group_offsets.tolist()
+            if not lista or self.dates[lista[-1]] <= self.dates[novos[0]]:
+                lista.extend(novos)
+            else:
+                for offset in novos:
+                    bisect.insort(lista, offset, key=self.dates.__getitem__)
+
+    # Recalcula o índice a partir dos resultados
+    def _rebuild(self, results):
+        self.reset()
+        self._apply(results)
+
+    # Jogadores com resultados, em ordem alfabética
+    def players(self):
+        with self.lock:
+            return sorted(self.names, key=str)
+
+    # Perfil do jogador: totais, saldos, forma recente e confrontos diretos (None se não houver jogos)
+    def profile(self, player, recent=RECENT_MATCHES):
+        with self.lock:
+            player_id = self.ids.get(player)
+            if player_id is None:
+                return None
+            totals = dict(zip(TOTAL_COLUMNS, self.totals[player_id].tolist()))
+            totals["Saldo_Sets"] = totals["Sets_Ganhos"] - totals["Sets_Perdidos"]
+            totals["Saldo_Games"] = totals["Games_Ganhos"] - totals["Games_Perdidos"]
+
+            recentes = []
+            for offset in reversed(self.offsets[player_id][-recent:]):
+                jogador1, jogador2, vencedor, sets1, sets2, games1, games2 = self.matches[offset]
+                if jogador1 == player:
+                    adversario, placar = jogador2, f"{sets1}x{sets2} ({games1}x{games2})"
+                else:
+                    adversario, placar = jogador1, f"{sets2}x{sets1} ({games2}x{games1})"
+                resultado = "V" if vencedor == player else "D" if vencedor == adversario else "E"
+                recentes.append((self.dates[offset], adversario, placar, resultado))
+
+            size = len(self.names)
+            games = self.h2h_games[player_id, :size]
+            opponents = np.flatnonzero(games)
+            h2h = pd.DataFrame({
+                "Adversário": [self.names[i] for i in opponents],
+                "Jogos": games[opponents],
+                "Vitórias": self.h2h_wins[player_id, opponents],
+                "Derrotas": self.h2h_wins[opponents, player_id],
+            })
+        return {
+            "totais": totals,
+            "recentes": pd.DataFrame(recentes, columns=["Data", "Adversário", "Placar", "Resultado"]),
+            "h2h": h2h.sort_values(by=["Jogos", "Adversário"], ascending=[False, True], kind="stable").reset_index(drop=True),
+        }
@@ -0,0 +1,72 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Arquivo (JSON lines) para exportar as medições de cada execução; vazio desativa a exportação
+PROFILE_LOG = os.environ.get("TORNEIO_PERFIL_LOG", "")
+
+# Quantas execuções recentes de cada seção entram nos percentis
+PROFILE_WINDOW = int(os.environ.get("TORNEIO_PERFIL_JANELA", "200"))
+
+# Medições de uma execução do script. Cada marcação atribui à seção o tempo
+# decorrido desde a marcação anterior, então o script não precisa ser reindentado.
+class RunTimer:
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self.started = self.last = time.perf_counter()
+        self.sections = {}  # seção -> segundos, na ordem de execução
+
+    # Função para encerrar a seção atual
+    def lap(self, name):
+        now = time.perf_counter()
+        self.sections[name] = self.sections.get(name, 0.0) + now - self.last
+        self.last = now
+
+    # Função para registrar a execução (com o tempo total) no acumulador compartilhado
+    def finish(self, **context):
+        self.sections["total"] = time.perf_counter() - self.started
+        self.profiler.record(self.sections, context)
+
+# Tempos das seções das últimas execuções, compartilhados entre as sessões, com percentis móveis
+class Profiler:
+    def __init__(self, window=PROFILE_WINDOW, log_path=PROFILE_LOG):
+        self.window = window
+        self.log_path = log_path
+        self.lock = threading.Lock()
+        self.samples = {}  # seção -> deque com os últimos tempos (segundos)
+
+    # Função para iniciar as medições de uma execução
+    def start(self):
+        return RunTimer(self)
+
+    def record(self, sections, context):
+        with self.lock:
+            for name, seconds in sections.items():
+                self.samples.setdefault(name, deque(maxlen=self.window)).append(seconds)
+            if self.log_path:
+                line = {"momento": datetime.now().isoformat(timespec="seconds"), **context, "secoes_ms": {name: round(seconds * 1000, 3) for name, seconds in sections.items()}}
+                with open(self.log_path, "a", encoding="utf-8") as handle:
+                    handle.write(json.dumps(line, ensure_ascii=False) + "\n")
+
+    # Função para calcular os percentis (em ms) de cada seção na janela móvel
+    def percentiles(self):
+        with self.lock:
+            samples = {name: np.array(values) * 1000 for name, values in self.samples.items()}
+        linhas = []
+        for name, values in samples.items():
+            p50, p90, p99 = np.percentile(values, [50, 90, 99])
+            linhas.append((name, len(values), p50, p90, p99, values[-1]))
+        return pd.DataFrame(linhas, columns=["Seção", "Execuções", "p50 (ms)", "p90 (ms)", "p99 (ms)", "Última (ms)"]).round(2)
+
+    # Função para descartar as medições acumuladas
+    def reset(self):
+        with self.lock:
+            self.samples.clear()
+
+profiler = Profiler()
@@ -0,0 +1,219 @@
+import argparse
+import html
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+from storage import DATE_FORMAT, SCHEDULE_COLUMNS
+
+# Pasta dos snapshots públicos (somente leitura) de classificação e agenda; vazio desativa a geração pelo app
+PUBLIC_DIR = os.environ.get("TORNEIO_PUBLICO", "publico")
+
+# Intervalo mínimo (s) entre verificações de alterações feitas pelo servidor HTTP
+REFRESH_SECONDS = 2.0
+
+CSS = """
+body { font-family: sans-serif; margin: 2em auto; max-width: 960px; padding: 0 1em; color: #31333F; }
+table { border-collapse: collapse; margin-bottom: 1.5em; width: 100%; }
+th, td { border: 1px solid #ddd; padding: 4px 8px; text-align: center; }
+th { background: #f0f2f6; }
+td:first-child { text-align: left; }
+"""
+
+# Função para gravar um arquivo de forma atômica (quem lê nunca vê um arquivo pela metade)
+def write_atomic(path, content):
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"  # o app e o servidor podem gravar ao mesmo tempo
+    with open(tmp_path, "w", encoding="utf-8", newline="") as handle:
+        handle.write(content)
+    os.replace(tmp_path, path)
+
+def html_page(titulo, corpo):
+    return (
+        f"<!DOCTYPE html><html lang='pt-BR'><head><meta charset='utf-8'><title>{html.escape(titulo)}</title>"
+        f"<meta name='viewport' content='width=device-width, initial-scale=1'><style>{CSS}</style></head>"
+        f"<body>{corpo}</body></html>"
+    )
+
+# Snapshots públicos de um torneio (classificação por grupo e agenda em JSON, CSV e HTML estático),
+# regenerados só quando a agenda ou os resultados salvos mudam
+class PublicSnapshots:
+    def __init__(self, tournament, data, pasta=None):
+        self.tournament = tournament
+        self.data = data
+        self.pasta = os.path.join(pasta or PUBLIC_DIR, tournament.id)
+        self.version_path = os.path.join(self.pasta, "versao.json")
+        self.lock = threading.Lock()
+        self.published = None  # assinatura dos dados publicados por este processo
+
+    # Assinatura dos dados salvos (agenda + resultados)
+    def signature(self):
+        return repr((self.data.schedule_store.signature(), self.data.results_store.signature()))
+
+    def _version_on_disk(self):
+        try:
+            with open(self.version_path, encoding="utf-8") as handle:
+                return json.load(handle).get("assinatura")
+        except (OSError, ValueError):
+            return None
+
+    # Função para obter as tabelas de classificação (a partir da classificação mantida em memória)
+    def standings(self):
+        self.data.standings.sync(self.data.results_store.signature(), self.data.load_results_signed)
+        tabelas = []
+        for classe in self.tournament.classes:
+            for grupo in self.tournament.grupos:
+                stats_df = self.data.standings.table(classe, grupo)
+                if stats_df is not None:
+                    tabelas.append((classe, grupo, stats_df))
+        return tabelas
+
+    # Função para obter a agenda do período do torneio, em ordem de data
+    def schedule(self):
+        tournament = self.tournament
+        schedule = self.data.schedule_store.load(tournament.start_date, tournament.end_date)
+        schedule = schedule[SCHEDULE_COLUMNS].sort_values(by="Data", kind="stable").reset_index(drop=True)
+        if not schedule.empty:
+            schedule["Data"] = pd.to_datetime(schedule["Data"]).dt.strftime(DATE_FORMAT)
+        return schedule
+
+    def _write(self, signature):
+        os.makedirs(self.pasta, exist_ok=True)
+        atualizado = datetime.now().isoformat(timespec="seconds")
+        tabelas = self.standings()
+        agenda = self.schedule()
+
+        # Classificação: um registro por jogador, com classe e grupo
+        linhas = [
+            stats_df.rename_axis("Jogador").reset_index().assign(Classe=classe, Grupo=grupo)
+            for classe, grupo, stats_df in tabelas
+        ]
+        classificacao = pd.concat(linhas, ignore_index=True) if linhas else pd.DataFrame(columns=["Jogador", "Classe", "Grupo"])
+        classificacao = classificacao[["Classe", "Grupo", "Jogador"] + [col for col in classificacao.columns if col not in ("Classe", "Grupo", "Jogador")]]
+        write_atomic(os.path.join(self.pasta, "classificacao.csv"), classificacao.to_csv(index=False))
+        write_atomic(os.path.join(self.pasta, "classificacao.json"), json.dumps({
+            "torneio": self.tournament.id,
+            "atualizado": atualizado,
+            "grupos": [
+                {"classe": classe, "grupo": int(grupo), "tabela": json.loads(stats_df.rename_axis("Jogador").reset_index().to_json(orient="records", force_ascii=False))}
+                for classe, grupo, stats_df in tabelas
+            ],
+        }, ensure_ascii=False))
+
+        # Agenda
+        write_atomic(os.path.join(self.pasta, "agenda.csv"), agenda.to_csv(index=False))
+        write_atomic(os.path.join(self.pasta, "agenda.json"), json.dumps({
+            "torneio": self.tournament.id,
+            "atualizado": atualizado,
+            "jogos": json.loads(agenda.to_json(orient="records", force_ascii=False)),
+        }, ensure_ascii=False))
+
+        # Página estática com as duas coisas
+        corpo = [f"<h1>{html.escape(self.tournament.nome)}</h1><p>Atualizado em {html.escape(atualizado.replace('T', ' '))}</p><h2>Classificação</h2>"]
+        if not tabelas:
+            corpo.append("<p>Nenhum resultado registrado ainda.</p>")
+        for classe, grupo, stats_df in tabelas:
+            corpo.append(f"<h3>Classe {html.escape(str(classe))} - Grupo {html.escape(str(grupo))}</h3>")
+            corpo.append(stats_df.rename_axis("Jogador").reset_index().to_html(index=False, border=0))
+        corpo.append("<h2>Agenda</h2>")
+        corpo.append(agenda.to_html(index=False, border=0) if not agenda.empty else "<p>Nenhum jogo agendado.</p>")
+        corpo.append("<p>Dados: <a href='classificacao.json'>classificacao.json</a> · <a href='classificacao.csv'>classificacao.csv</a> · "
+                     "<a href='agenda.json'>agenda.json</a> · <a href='agenda.csv'>agenda.csv</a></p>")
+        write_atomic(os.path.join(self.pasta, "index.html"), html_page(self.tournament.nome, "".join(corpo)))
+
+        # A versão é gravada por último: se ela bate com a assinatura, os demais arquivos já estão atualizados
+        write_atomic(self.version_path, json.dumps({"assinatura": signature, "atualizado": atualizado}))
+
+    # Função para regenerar os snapshots se os dados mudaram (ou sempre, com force=True); retorna se regenerou
+    def publish(self, force=False):
+        signature = self.signature()
+        with self.lock:
+            if not force and signature == self.published:
+                return False
+            if not force and signature == self._version_on_disk():
+                self.published = signature
+                return False
+            self._write(signature)
+            self.published = signature
+            return True
+
+# Função para gerar a página inicial com os links de todos os torneios
+def publish_index(registry, pasta=None):
+    pasta = pasta or PUBLIC_DIR
+    os.makedirs(pasta, exist_ok=True)
+    itens = "".join(
+        f"<li><a href='{html.escape(torneio_id)}/'>{html.escape(registry.get(torneio_id).nome)}</a></li>"
+        for torneio_id in registry.ids()
+    )
+    pagina = html_page("Torneios", f"<h1>Torneios</h1><ul>{itens}</ul>")
+    path = os.path.join(pasta, "index.html")
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as handle:
+            if handle.read() == pagina:
+                return
+    write_atomic(path, pagina)
+
+# Função para regenerar os snapshots de todos os torneios que mudaram
+def publish_all(registry, pasta=None, force=False):
+    publish_index(registry, pasta)
+    return [torneio_id for torneio_id in registry.ids() if registry.data(torneio_id).public_snapshots(pasta).publish(force)]
+
+# Servidor somente leitura dos snapshots: arquivos estáticos, com verificação de alterações
+# (no máximo a cada REFRESH_SECONDS) antes de responder
+class SnapshotHandler(SimpleHTTPRequestHandler):
+    registry = None
+    pasta = None
+    refresh_lock = threading.Lock()
+    last_refresh = 0.0
+
+    def _refresh(self):
+        cls = type(self)
+        with cls.refresh_lock:
+            if time.monotonic() - cls.last_refresh < REFRESH_SECONDS:
+                return
+            publish_all(cls.registry, cls.pasta)
+            cls.last_refresh = time.monotonic()
+
+    def do_GET(self):
+        self._refresh()
+        super().do_GET()
+
+    def do_HEAD(self):
+        self._refresh()
+        super().do_HEAD()
+
+# Snapshots e servidor pela linha de comando:
+#   python public.py [--saida publico] [--forcar]                # gera os snapshots de todos os torneios
+#   python public.py --servir [--porta 8000] [--endereco 0.0.0.0]  # gera e serve os arquivos
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera (e opcionalmente serve) os snapshots públicos de classificação e agenda.")
+    parser.add_argument("--saida", default=PUBLIC_DIR or "publico", help="pasta dos snapshots")
+    parser.add_argument("--forcar", action="store_true", help="regenera mesmo sem alterações")
+    parser.add_argument("--servir", action="store_true", help="serve os snapshots por HTTP")
+    parser.add_argument("--endereco", default="127.0.0.1", help="endereço do servidor HTTP")
+    parser.add_argument("--porta", type=int, default=8000, help="porta do servidor HTTP")
+    args = parser.parse_args(argv)
+
+    from tournaments import TournamentRegistry
+    registry = TournamentRegistry()
+    atualizados = publish_all(registry, args.saida, force=args.forcar)
+    print(f"Snapshots em {args.saida}: {len(atualizados)} torneio(s) atualizado(s)")
+    if args.servir:
+        SnapshotHandler.registry = registry
+        SnapshotHandler.pasta = args.saida
+        server = ThreadingHTTPServer((args.endereco, args.porta), partial(SnapshotHandler, directory=args.saida))
+        print(f"Servindo em http://{args.endereco}:{args.porta}/ (Ctrl+C para sair)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+from array import array
+
+import pandas as pd
+
+from cache import SyncedState
+
+# Parâmetros do Elo
+INITIAL_RATING = 1500.0
+K_FACTOR = 32.0
+
+# Ranking Elo calculado sobre os resultados, em ordem de data, como um fluxo.
+# O estado de cada jogador fica em arrays compactos indexados por um id inteiro;
+# cada resultado novo custa O(1). O histórico (jogador, data, rating) é guardado
+# em arrays para os gráficos.
+class RatingEngine(SyncedState):
+    def __init__(self, initial=INITIAL_RATING, k=K_FACTOR):
+        super().__init__()
+        self.initial = initial
+        self.k = k
+        self.reset()
+
+    def reset(self):
+        self.ids = {}                       # jogador -> id
+        self.names = []                     # id -> jogador
+        self.ratings = array("d")           # id -> rating atual
+        self.games = array("l")             # id -> jogos disputados
+        self.history_player = array("l")    # histórico: id do jogador
+        self.history_date = array("q")      # histórico: data (ns desde a época)
+        self.history_rating = array("d")    # histórico: rating após o jogo
+        self.last_date = None               # data do último resultado processado
+
+    def _id(self, player):
+        player_id = self.ids.get(player)
+        if player_id is None:
+            player_id = len(self.names)
+            self.ids[player] = player_id
+            self.names.append(player)
+            self.ratings.append(self.initial)
+            self.games.append(0)
+        return player_id
+
+    # Aplica um resultado: score1 = 1 (vitória do jogador 1), 0 (vitória do jogador 2) ou 0.5 (empate)
+    def _update(self, jogador1, jogador2, score1, when):
+        id1, id2 = self._id(jogador1), self._id(jogador2)
+        ratings = self.ratings
+        expected1 = 1.0 / (1.0 + 10.0 ** ((ratings[id2] - ratings[id1]) / 400.0))
+        delta = self.k * (score1 - expected1)
+        ratings[id1] += delta
+        ratings[id2] -= delta
+        self.games[id1] += 1
+        self.games[id2] += 1
+        self.history_player.extend((id1, id2))
+        self.history_date.extend((when, when))
+        self.history_rating.extend((ratings[id1], ratings[id2]))
+
+    def _process(self, results):
+        if results.empty:
+            return
+        ordered = results.sort_values(by="Data", kind="stable")
+        datas = pd.to_datetime(ordered["Data"]).astype("datetime64[ns]").astype("int64").tolist()
+        jogadores1 = ordered["Jogador1"].tolist()
+        jogadores2 = ordered["Jogador2"].tolist()
+        vencedores = ordered["Vencedor"].tolist()
+        update = self._update
+        for when, jogador1, jogador2, vencedor in zip(datas, jogadores1, jogadores2, vencedores):
+            update(jogador1, jogador2, 1.0 if vencedor == jogador1 else 0.0 if vencedor == jogador2 else 0.5, when)
+        self.last_date = datas[-1] if self.last_date is None else max(self.last_date, datas[-1])
+
+    # Recalcula tudo a partir dos resultados
+    def _rebuild(self, results):
+        self.reset()
+        self._process(results)
+
+    # Aplica resultados novos em O(1) cada. Um resultado com data anterior ao último
+    # processado muda a ordem do fluxo, então o ranking é invalidado e recalculado.
+    def _apply(self, results):
+        first = pd.Timestamp(results["Data"].min()).as_unit("ns").value
+        if self.last_date is not None and first < self.last_date:
+            return False
+        self._process(results)
+
+    # Tabela do ranking atual
+    def table(self):
+        with self.lock:
+            table = pd.DataFrame({"Jogador": self.names, "Rating": self.ratings.tolist(), "Jogos": self.games.tolist()})
+        table["Rating"] = table["Rating"].round(1)
+        return table.sort_values(by="Rating", ascending=False, kind="stable").reset_index(drop=True)
+
+    # Histórico de ratings (para gráficos), opcionalmente só de alguns jogadores
+    def history(self, players=None):
+        with self.lock:
+            history = pd.DataFrame({
+                "Data": pd.to_datetime(self.history_date.tolist()),
+                "Jogador": pd.Categorical.from_codes(self.history_player.tolist(), categories=self.names) if self.names else [],
+                "Rating": self.history_rating.tolist(),
+            })
+        if players is not None:
+            history = history[history["Jogador"].isin(players)]
+        return history
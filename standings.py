@@ -0,0 +1,152 @@
+import numpy as np
+import pandas as pd
+
+from cache import SyncedState
+
+# Colunas das tabelas de classificação, na mesma ordem usada pelo app
+STATS_COLUMNS = [
+    "Jogos", "Vitórias", "Derrotas",
+    "Sets_Ganhos", "Sets_Perdidos",
+    "Games_Ganhos", "Games_Perdidos",
+    "Tiebreaks_Ganhos", "Tiebreaks_Perdidos",
+]
+
+# Critérios de desempate da classificação
+SORT_COLUMNS = ["Vitórias", "Saldo_Sets", "Saldo_Games", "Saldo_Tiebreaks"]
+
+# Função para adicionar os saldos e ordenar uma tabela de classificação
+def finalize_table(stats_df):
+    stats_df = stats_df[STATS_COLUMNS].astype("int64")
+    stats_df["Saldo_Sets"] = stats_df["Sets_Ganhos"] - stats_df["Sets_Perdidos"]
+    stats_df["Saldo_Games"] = stats_df["Games_Ganhos"] - stats_df["Games_Perdidos"]
+    stats_df["Saldo_Tiebreaks"] = stats_df["Tiebreaks_Ganhos"] - stats_df["Tiebreaks_Perdidos"]
+    return stats_df.sort_values(by=SORT_COLUMNS, ascending=False)
+
+# Função para transformar cada resultado em duas linhas, uma por jogador
+def melt_results(results):
+    n = len(results)
+
+    def pair(col1, col2):
+        a = pd.to_numeric(results[col1], errors="coerce").fillna(0).to_numpy(dtype="int64")
+        b = pd.to_numeric(results[col2], errors="coerce").fillna(0).to_numpy(dtype="int64")
+        # Intercala jogador 1 e jogador 2 de cada jogo para preservar a ordem de aparição
+        return np.column_stack([a, b]).ravel(), np.column_stack([b, a]).ravel()
+
+    jogador1 = results["Jogador1"].to_numpy(dtype=object)
+    jogador2 = results["Jogador2"].to_numpy(dtype=object)
+    # Mantém a regra original: qualquer vencedor diferente do jogador 1 conta vitória para o jogador 2
+    vitoria1 = (results["Vencedor"].to_numpy(dtype=object) == jogador1).astype("int64")
+
+    sets_ganhos, sets_perdidos = pair("Sets_Jogador1", "Sets_Jogador2")
+    games_ganhos, games_perdidos = pair("Games_Jogador1", "Games_Jogador2")
+    tiebreaks_ganhos, tiebreaks_perdidos = pair("Tiebreaks_Jogador1", "Tiebreaks_Jogador2")
+    vitorias = np.column_stack([vitoria1, 1 - vitoria1]).ravel()
+
+    return pd.DataFrame({
+        "Classe": np.repeat(results["Classe"].to_numpy(dtype=object), 2),
+        "Grupo": np.repeat(results["Grupo"].to_numpy(), 2),
+        "Jogador": np.column_stack([jogador1, jogador2]).ravel(),
+        "Jogos": np.ones(2 * n, dtype="int64"),
+        "Vitórias": vitorias,
+        "Derrotas": 1 - vitorias,
+        "Sets_Ganhos": sets_ganhos,
+        "Sets_Perdidos": sets_perdidos,
+        "Games_Ganhos": games_ganhos,
+        "Games_Perdidos": games_perdidos,
+        "Tiebreaks_Ganhos": tiebreaks_ganhos,
+        "Tiebreaks_Perdidos": tiebreaks_perdidos,
+    })
+
+# Função para somar as estatísticas por classe, grupo e jogador (na ordem de aparição)
+def aggregate_totals(results):
+    long_df = melt_results(results)
+    return long_df.groupby(["Classe", "Grupo", "Jogador"], sort=False)[STATS_COLUMNS].sum()
+
+# Função para calcular a classificação de todas as classes e grupos de uma vez
+def compute_all_standings(results):
+    if results.empty:
+        return {}
+    totals = aggregate_totals(results)
+
+    # Saldos e ordenação em uma única passada; a ordenação estável preserva a ordem dentro de cada grupo
+    totals = finalize_table(totals)
+
+    tables = {}
+    for (classe, grupo), table in totals.groupby(level=["Classe", "Grupo"], sort=False):
+        table = table.droplevel(["Classe", "Grupo"])
+        table.index.name = None
+        tables[(classe, grupo)] = table
+    return tables
+
+# Função para calcular estatísticas de um grupo (opcionalmente restrito a uma classe)
+def calculate_group_stats(results, group, classe=None):
+    mask = results["Grupo"] == group
+    if classe is not None:
+        mask &= results["Classe"] == classe
+    subset = results[mask]
+    if subset.empty:
+        return pd.DataFrame(columns=STATS_COLUMNS + ["Saldo_Sets", "Saldo_Games", "Saldo_Tiebreaks"])
+    long_df = melt_results(subset)
+    table = long_df.groupby("Jogador", sort=False)[STATS_COLUMNS].sum()
+    table.index.name = None
+    return finalize_table(table)
+
+# Função para calcular as estatísticas de um único resultado para os dois jogadores
+def result_deltas(row):
+    def number(col):
+        value = pd.to_numeric(row[col], errors="coerce")
+        return 0 if pd.isna(value) else int(value)
+
+    vitoria1 = int(row["Vencedor"] == row["Jogador1"])
+    delta1 = [1, vitoria1, 1 - vitoria1]
+    delta2 = [1, 1 - vitoria1, vitoria1]
+    for nome in ("Sets", "Games", "Tiebreaks"):
+        ganhos1, ganhos2 = number(f"{nome}_Jogador1"), number(f"{nome}_Jogador2")
+        delta1 += [ganhos1, ganhos2]
+        delta2 += [ganhos2, ganhos1]
+    return (row["Jogador1"], delta1), (row["Jogador2"], delta2)
+
+# Classificação mantida em memória e atualizada resultado a resultado.
+# É compartilhada entre as sessões; a assinatura do arquivo de resultados
+# indica se o estado ainda corresponde ao que está salvo em disco.
+class StandingsStore(SyncedState):
+    def __init__(self):
+        super().__init__()
+        self.counters = {}   # (Classe, Grupo) -> {Jogador: [contadores na ordem de STATS_COLUMNS]}
+        self.versions = {}   # (Classe, Grupo) -> versão, incrementada a cada alteração
+        self.tables = {}     # (Classe, Grupo) -> (versão, DataFrame já ordenado)
+
+    # Recalcula tudo a partir do DataFrame de resultados
+    def _rebuild(self, results):
+        self.counters = {}
+        self.tables = {}
+        if not results.empty:
+            totals = aggregate_totals(results)
+            for (classe, grupo, jogador), values in zip(totals.index, totals.to_numpy().tolist()):
+                self.counters.setdefault((classe, grupo), {})[jogador] = values
+        self.versions = {key: self.versions.get(key, 0) + 1 for key in self.counters}
+
+    # Aplica os novos resultados, em O(1) cada
+    def _apply(self, results):
+        for row in results.to_dict("records"):
+            key = (row["Classe"], row["Grupo"])
+            group = self.counters.setdefault(key, {})
+            for jogador, delta in result_deltas(row):
+                counters = group.setdefault(jogador, [0] * len(STATS_COLUMNS))
+                for i, value in enumerate(delta):
+                    counters[i] += value
+            self.versions[key] = self.versions.get(key, 0) + 1
+
+    # Retorna a tabela ordenada de um grupo, montada só quando o grupo muda
+    def table(self, classe, grupo):
+        with self.lock:
+            key = (classe, grupo)
+            if key not in self.counters:
+                return None
+            version = self.versions[key]
+            cached = self.tables.get(key)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            stats_df = finalize_table(pd.DataFrame.from_dict(self.counters[key], orient="index", columns=STATS_COLUMNS))
+            self.tables[key] = (version, stats_df)
+            return stats_df
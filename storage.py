@@ -0,0 +1,555 @@
+import datetime
+import json
+import os
+import sqlite3
+import threading
+from collections import deque
+from contextlib import closing, contextmanager
+
+import pandas as pd
+
+from cache import file_signature, frame_cache
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Nome do arquivo para salvar os jogos agendados
+SCHEDULE_FILE = "agendamentos.csv"
+RESULTS_FILE = "resultados.csv"
+
+SCHEDULE_COLUMNS = ["Data", "Horario", "Classe", "Grupo", "Jogador1", "Jogador2"]
+RESULT_COLUMNS = SCHEDULE_COLUMNS + ["Vencedor", "Sets_Jogador1", "Sets_Jogador2", "Games_Jogador1", "Games_Jogador2", "Tiebreaks_Jogador1", "Tiebreaks_Jogador2"]
+
+# Backend de armazenamento: "csv" (padrão, CSV com log de operações), "parquet" (snapshot colunar com log de operações) ou "sqlite"
+STORAGE_BACKEND = os.environ.get("TORNEIO_STORAGE", "csv")
+DATABASE_FILE = os.environ.get("TORNEIO_DB", "torneio.db")
+
+# Colunas numéricas (as demais são texto)
+INTEGER_COLUMNS = {"Grupo", "Sets_Jogador1", "Sets_Jogador2", "Games_Jogador1", "Games_Jogador2", "Tiebreaks_Jogador1", "Tiebreaks_Jogador2"}
+
+# Colunas de texto repetitivo guardadas como categóricas no snapshot Parquet;
+# as colunas de jogadores compartilham as mesmas categorias para poderem ser comparadas entre si
+CATEGORY_COLUMNS = ["Horario", "Classe"]
+PLAYER_COLUMNS = ["Jogador1", "Jogador2", "Vencedor"]
+
+# Tamanho do log (em bytes) a partir do qual ele é incorporado ao CSV
+COMPACT_BYTES = 256 * 1024
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Trava exclusiva entre processos e sessões, feita sobre um arquivo auxiliar
+@contextmanager
+def file_lock(path):
+    with open(path, "a+b") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+# Função para converter linhas de um DataFrame em registros serializáveis em JSON
+def to_records(frame):
+    frame = frame.copy()
+    if pd.api.types.is_datetime64_any_dtype(frame["Data"]):
+        frame["Data"] = frame["Data"].dt.strftime(DATE_FORMAT)
+    else:
+        frame["Data"] = frame["Data"].astype(str)
+    return frame.to_dict("records")
+
+def _json_default(value):
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+# Função para converter valores numpy/pandas em tipos nativos do Python
+def _native(value):
+    if pd.isna(value):
+        return None
+    if hasattr(value, "item"):
+        return value.item()
+    return value
+
+# Função para aplicar os filtros de data, classe, grupo e jogador em memória
+def filter_frame(frame, start=None, end=None, data=None, classe=None, grupo=None, jogador=None):
+    if frame.empty:
+        return frame
+    mask = pd.Series(True, index=frame.index)
+    if start is not None:
+        mask &= frame["Data"] >= pd.Timestamp(start)
+    if end is not None:
+        mask &= frame["Data"] < pd.Timestamp(end) + pd.Timedelta(days=1)
+    if data is not None:
+        mask &= frame["Data"].dt.normalize() == pd.Timestamp(data)
+    if classe is not None:
+        mask &= frame["Classe"] == classe
+    if grupo is not None:
+        mask &= frame["Grupo"] == grupo
+    if jogador is not None:
+        mask &= (frame["Jogador1"] == jogador) | (frame["Jogador2"] == jogador)
+    return frame if mask.all() else frame[mask]
+
+# Função para converter as colunas de texto repetitivo em categóricas (sem custo se já estiverem)
+def categorize(frame):
+    players = [col for col in PLAYER_COLUMNS if col in frame.columns]
+    columns = [col for col in CATEGORY_COLUMNS if col in frame.columns] + players
+    if all(isinstance(frame[col].dtype, pd.CategoricalDtype) for col in columns) and len({frame[col].dtype for col in players}) <= 1:
+        return frame
+    frame = frame.copy()
+    for col in CATEGORY_COLUMNS:
+        if col in frame.columns:
+            frame[col] = frame[col].astype("category")
+    if players:
+        names = pd.concat([frame[col].astype(object) for col in players], ignore_index=True).dropna().unique()
+        dtype = pd.CategoricalDtype(sorted(names, key=str))
+        for col in players:
+            frame[col] = frame[col].astype(object).astype(dtype)
+    return frame
+
+# Função para gerar uma chave comparável por linha (usada para localizar linhas a excluir)
+def row_keys(frame):
+    columns = [frame["Data"].dt.strftime(DATE_FORMAT)] + [frame[col].astype(str) for col in frame.columns if col != "Data"]
+    return list(zip(*columns))
+
+# CSV com um log de operações (JSON lines) ao lado. Cada gravação só acrescenta
+# uma linha ao log; de tempos em tempos o log é incorporado ao CSV (compactação),
+# que é reescrito em um arquivo temporário e trocado de forma atômica.
+class Journal:
+    def __init__(self, path, columns, compact_bytes=COMPACT_BYTES):
+        self.path = path
+        self.columns = columns
+        self.compact_bytes = compact_bytes
+        self.log_path = path + ".log"
+        self.lock_path = path + ".lock"
+        self.tmp_path = path + ".tmp"
+        self.folded_path = path + ".log.folded"
+
+    # Assinatura do estado salvo (CSV + log); muda a cada gravação
+    def signature(self):
+        return (file_signature(self.path), file_signature(self.log_path))
+
+    def empty(self):
+        return pd.DataFrame(columns=self.columns)
+
+    def _frame(self, records):
+        frame = pd.DataFrame.from_records(records, columns=self.columns)
+        frame["Data"] = pd.to_datetime(frame["Data"])
+        return frame
+
+    # Conclui ou desfaz uma compactação interrompida
+    def _recover(self):
+        if not os.path.exists(self.folded_path):
+            return
+        if os.path.exists(self.tmp_path):
+            # O CSV novo não chegou a ser trocado: o log antigo continua valendo
+            os.remove(self.tmp_path)
+            os.replace(self.folded_path, self.log_path)
+        else:
+            os.remove(self.folded_path)
+
+    def _read_snapshot(self):
+        if os.path.exists(self.path):
+            return pd.read_csv(self.path, parse_dates=["Data"])
+        return self.empty()
+
+    def _read_ops(self):
+        if not os.path.exists(self.log_path):
+            return []
+        with open(self.log_path, encoding="utf-8") as handle:
+            # Uma linha incompleta no final (gravação interrompida) é ignorada
+            ops = []
+            for line in handle:
+                try:
+                    ops.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break
+            return ops
+
+    # Reaplica o log sobre o CSV
+    def _replay(self, base, ops):
+        if not ops:
+            return base
+        inserted = []
+        inserted_at = []
+        deletes = []
+        for number, op in enumerate(ops):
+            if op["op"] == "insert":
+                inserted.extend(op["rows"])
+                inserted_at.extend([number] * len(op["rows"]))
+            elif op["op"] == "delete":
+                deletes.append((number, op["rows"]))
+
+        frames = [frame for frame in (base, self._frame(inserted)) if not frame.empty]
+        combined = pd.concat(frames, ignore_index=True) if frames else self.empty()
+        if not deletes:
+            return combined
+
+        # Cada exclusão remove a primeira ocorrência ainda existente da linha,
+        # considerando apenas as linhas inseridas antes dela
+        op_number = [-1] * len(base) + inserted_at
+        positions = {}
+        for position, key in enumerate(row_keys(combined[self.columns])):
+            positions.setdefault(key, deque()).append(position)
+        alive = [True] * len(combined)
+        for number, rows in deletes:
+            for key in row_keys(self._frame(rows)):
+                candidates = positions.get(key)
+                if candidates and op_number[candidates[0]] < number:
+                    alive[candidates.popleft()] = False
+        return combined[alive].reset_index(drop=True)
+
+    def _load(self):
+        self._recover()
+        return self._replay(self._read_snapshot(), self._read_ops())
+
+    def _write_file(self, frame, path):
+        frame.to_csv(path, index=False)
+
+    # Grava o estado completo no CSV e descarta o log, sem janela de inconsistência
+    def _write_snapshot(self, frame):
+        self._write_file(frame, self.tmp_path)
+        if os.path.exists(self.log_path):
+            os.replace(self.log_path, self.folded_path)
+        os.replace(self.tmp_path, self.path)
+        if os.path.exists(self.folded_path):
+            os.remove(self.folded_path)
+
+    # Descarta uma linha incompleta no final do log, deixada por uma gravação interrompida
+    def _repair_tail(self):
+        if not os.path.exists(self.log_path):
+            return
+        with open(self.log_path, "rb+") as handle:
+            size = handle.seek(0, os.SEEK_END)
+            if size == 0:
+                return
+            handle.seek(size - 1)
+            if handle.read(1) == b"\n":
+                return
+            handle.seek(0)
+            handle.truncate(handle.read().rfind(b"\n") + 1)
+
+    def _append_op(self, op, frame):
+        line = json.dumps({"op": op, "rows": to_records(frame[self.columns])}, ensure_ascii=False, default=_json_default)
+        self._repair_tail()
+        with open(self.log_path, "a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+        if os.path.getsize(self.log_path) >= self.compact_bytes:
+            self._write_snapshot(self._load())
+
+    # Lê o estado e a assinatura com a trava, para que correspondam um ao outro
+    def _locked_load(self):
+        with file_lock(self.lock_path):
+            frame = self._load()
+            return frame, self.signature()
+
+    # Função para liberar da memória as leituras em cache
+    def evict(self):
+        frame_cache.invalidate(self.path)
+
+    # Função para carregar o estado atual (CSV + log); a leitura é compartilhada entre
+    # as sessões pelo cache e só é refeita quando os arquivos mudam
+    def load(self, start=None, end=None):
+        return self.load_signed(start, end)[0]
+
+    # Função para carregar o estado atual junto com a assinatura em que ele foi lido
+    def load_signed(self, start=None, end=None):
+        full, signature = frame_cache.get_signed((self.path, None, None), self.signature(), self._locked_load)
+        if start is None and end is None:
+            return full, signature
+        return frame_cache.get_signed((self.path, start, end), signature,
+                                      lambda: (filter_frame(full, start=start, end=end), signature))
+
+    # Função para consultar uma página das linhas filtradas, ordenadas por data
+    def query(self, limit=None, offset=0, **filters):
+        frame = filter_frame(self.load(), **filters).sort_values(by="Data", kind="stable")
+        return frame.iloc[offset:] if limit is None else frame.iloc[offset:offset + limit]
+
+    # Função para contar as linhas filtradas
+    def count(self, **filters):
+        return len(filter_frame(self.load(), **filters))
+
+    # Função para acrescentar linhas; retorna as assinaturas de antes e depois da gravação,
+    # lidas com a trava, para que os estados em memória apliquem exatamente esta gravação
+    def append(self, frame):
+        with file_lock(self.lock_path):
+            self._recover()
+            before = self.signature()
+            self._append_op("insert", frame)
+            return before, self.signature()
+
+    # Função para excluir linhas (uma ocorrência de cada); retorna as assinaturas como append
+    def delete(self, frame):
+        with file_lock(self.lock_path):
+            self._recover()
+            before = self.signature()
+            self._append_op("delete", frame)
+            return before, self.signature()
+
+    # Função para substituir todo o conteúdo
+    def replace(self, frame):
+        with file_lock(self.lock_path):
+            self._recover()
+            self._write_snapshot(frame[self.columns])
+
+    # Função para incorporar o log ao CSV
+    def compact(self):
+        with file_lock(self.lock_path):
+            self._write_snapshot(self._load())
+
+    # Função para apagar o CSV e o log
+    def clear(self):
+        with file_lock(self.lock_path):
+            self._recover()
+            existed = os.path.exists(self.path) or os.path.exists(self.log_path)
+            for path in (self.path, self.log_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            return existed
+
+# Variante do Journal com o snapshot em Parquet: datas em datetime nativo e textos
+# repetitivos (jogadores, classe, horário) como categóricos, então a leitura não
+# reinterpreta datas e ocupa bem menos memória por linha. O CSV continua sendo o
+# formato de importação (na primeira execução) e de exportação.
+class ParquetJournal(Journal):
+    def __init__(self, path, columns, csv_path=None, compact_bytes=COMPACT_BYTES):
+        super().__init__(path, columns, compact_bytes)
+        self.csv_path = csv_path
+
+    # Além de concluir compactações interrompidas, importa o CSV na primeira execução
+    def _recover(self):
+        super()._recover()
+        if os.path.exists(self.path) or os.path.exists(self.log_path):
+            return
+        if self.csv_path and (os.path.exists(self.csv_path) or os.path.exists(self.csv_path + ".log")):
+            self._write_snapshot(Journal(self.csv_path, self.columns)._locked_load()[0])
+
+    def _read_snapshot(self):
+        if os.path.exists(self.path):
+            return pd.read_parquet(self.path)
+        return self.empty()
+
+    def _load(self):
+        return categorize(super()._load())
+
+    def _write_file(self, frame, path):
+        frame = categorize(frame[self.columns])
+        frame["Data"] = pd.to_datetime(frame["Data"])
+        frame.to_parquet(path, index=False)
+
+    # Função para apagar o conteúdo; um snapshot vazio é mantido para que o CSV não seja importado de novo
+    def clear(self):
+        with file_lock(self.lock_path):
+            self._recover()
+            existed = not self._load().empty
+            self._write_snapshot(self.empty())
+            return existed
+
+# Tabela SQLite com índices por data, classe/grupo e jogadores. Os filtros viram
+# consultas indexadas e só a página pedida é carregada em memória. Uma tabela de
+# versões é incrementada a cada gravação e serve de assinatura para as sessões.
+class SqliteTable:
+    def __init__(self, db_path, table, columns, csv_path=None):
+        self.db_path = db_path
+        self.table = table
+        self.columns = columns
+        self.csv_path = csv_path
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    self._create(conn)
+                    self._initialized = True
+        return conn
+
+    # Transação de escrita que já começa com a trava do banco (BEGIN IMMEDIATE):
+    # o que for lido dentro dela não muda até o commit, nem por outro processo
+    @contextmanager
+    def _transaction(self, conn):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    def _create(self, conn):
+        definitions = ", ".join(f"{col} {'INTEGER' if col in INTEGER_COLUMNS else 'TEXT'}" for col in self.columns)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # A verificação da tabela e a importação do CSV ficam na mesma transação: se várias
+        # sessões ou processos abrirem o banco ao mesmo tempo, só o primeiro importa
+        with self._transaction(conn):
+            existed = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (self.table,)).fetchone()
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {self.table} ({definitions})")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {self.table}_data ON {self.table} (Data)")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {self.table}_classe_grupo ON {self.table} (Classe, Grupo)")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {self.table}_jogador1 ON {self.table} (Jogador1)")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {self.table}_jogador2 ON {self.table} (Jogador2)")
+            conn.execute("CREATE TABLE IF NOT EXISTS versoes (tabela TEXT PRIMARY KEY, versao INTEGER NOT NULL)")
+            conn.execute("INSERT OR IGNORE INTO versoes (tabela, versao) VALUES (?, 0)", (self.table,))
+            # Na primeira execução, importa o CSV existente
+            if not existed and self.csv_path and (os.path.exists(self.csv_path) or os.path.exists(self.csv_path + ".log")):
+                self._insert(conn, Journal(self.csv_path, self.columns).load())
+
+    def _records(self, frame):
+        return [tuple(_native(value) for value in record.values()) for record in to_records(frame[self.columns])]
+
+    def _insert(self, conn, frame):
+        if frame.empty:
+            return
+        placeholders = ", ".join("?" for _ in self.columns)
+        conn.executemany(f"INSERT INTO {self.table} ({', '.join(self.columns)}) VALUES ({placeholders})", self._records(frame))
+        self._bump(conn)
+
+    def _bump(self, conn):
+        conn.execute("UPDATE versoes SET versao = versao + 1 WHERE tabela = ?", (self.table,))
+
+    def _where(self, start=None, end=None, data=None, classe=None, grupo=None, jogador=None):
+        clauses, params = [], []
+        if data is not None:
+            start = end = data
+        if start is not None:
+            clauses.append("Data >= ?")
+            params.append(f"{start:%Y-%m-%d}")
+        if end is not None:
+            clauses.append("Data < ?")
+            params.append(f"{end + datetime.timedelta(days=1):%Y-%m-%d}")
+        if classe is not None:
+            clauses.append("Classe = ?")
+            params.append(classe)
+        if grupo is not None:
+            clauses.append("Grupo = ?")
+            params.append(int(grupo))
+        if jogador is not None:
+            clauses.append("(Jogador1 = ? OR Jogador2 = ?)")
+            params += [jogador, jogador]
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def _read(self, sql, params):
+        with closing(self._connect()) as conn:
+            return self._frame(conn, sql, params)
+
+    def _frame(self, conn, sql, params):
+        frame = pd.read_sql_query(sql, conn, params=params, index_col="id")
+        frame.index.name = None
+        frame["Data"] = pd.to_datetime(frame["Data"], format=DATE_FORMAT)
+        return frame
+
+    # Lê as linhas e a versão da tabela na mesma transação de leitura, para que correspondam
+    def _read_signed(self, sql, params):
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN")
+            try:
+                version = self._version(conn)
+                return self._frame(conn, sql, params), version
+            finally:
+                conn.rollback()
+
+    def _version(self, conn):
+        return (self.db_path, conn.execute("SELECT versao FROM versoes WHERE tabela = ?", (self.table,)).fetchone()[0])
+
+    # Assinatura do estado salvo: a versão da tabela
+    def signature(self):
+        with closing(self._connect()) as conn:
+            return self._version(conn)
+
+    # Função para liberar da memória as leituras em cache
+    def evict(self):
+        frame_cache.invalidate(self.db_path)
+
+    # Função para carregar as linhas do período (ou todas), compartilhadas entre as sessões pelo cache
+    def load(self, start=None, end=None):
+        return self.load_signed(start, end)[0]
+
+    # Função para carregar as linhas do período junto com a versão da tabela em que foram lidas
+    def load_signed(self, start=None, end=None):
+        where, params = self._where(start=start, end=end)
+        sql = f"SELECT rowid AS id, {', '.join(self.columns)} FROM {self.table}{where} ORDER BY rowid"
+        return frame_cache.get_signed((self.db_path, self.table, start, end), self.signature(),
+                                      lambda: self._read_signed(sql, params))
+
+    # Função para consultar uma página das linhas filtradas, ordenadas por data
+    def query(self, limit=None, offset=0, **filters):
+        where, params = self._where(**filters)
+        sql = f"SELECT rowid AS id, {', '.join(self.columns)} FROM {self.table}{where} ORDER BY Data, rowid"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        elif offset:
+            sql += " LIMIT -1 OFFSET ?"
+            params.append(offset)
+        return self._read(sql, params)
+
+    # Função para contar as linhas filtradas
+    def count(self, **filters):
+        where, params = self._where(**filters)
+        with closing(self._connect()) as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM {self.table}{where}", params).fetchone()[0]
+
+    # Função para acrescentar linhas; retorna as versões de antes e depois da gravação,
+    # lidas na mesma transação
+    def append(self, frame):
+        with closing(self._connect()) as conn, self._transaction(conn):
+            before = self._version(conn)
+            self._insert(conn, frame)
+            return before, self._version(conn)
+
+    # Função para excluir linhas (uma ocorrência de cada); retorna as versões como append
+    def delete(self, frame):
+        where = " AND ".join(f"{col} = ?" for col in self.columns)
+        with closing(self._connect()) as conn, self._transaction(conn):
+            before = self._version(conn)
+            conn.executemany(f"DELETE FROM {self.table} WHERE rowid = (SELECT rowid FROM {self.table} WHERE {where} ORDER BY rowid LIMIT 1)", self._records(frame))
+            self._bump(conn)
+            return before, self._version(conn)
+
+    # Função para substituir todo o conteúdo
+    def replace(self, frame):
+        with closing(self._connect()) as conn, conn:
+            conn.execute(f"DELETE FROM {self.table}")
+            self._insert(conn, frame)
+            self._bump(conn)
+
+    # Função para apagar todas as linhas
+    def clear(self):
+        with closing(self._connect()) as conn, conn:
+            existed = conn.execute(f"DELETE FROM {self.table}").rowcount > 0
+            self._bump(conn)
+            return existed
+
+# Função para obter o caminho do snapshot Parquet correspondente a um CSV
+def parquet_path(csv_path):
+    return os.path.splitext(csv_path)[0] + ".parquet"
+
+# Função para abrir os armazenamentos de agenda e resultados (de um torneio) no backend configurado
+def open_stores(schedule_file=SCHEDULE_FILE, results_file=RESULTS_FILE, database_file=DATABASE_FILE):
+    if STORAGE_BACKEND == "sqlite":
+        return (SqliteTable(database_file, "agendamentos", SCHEDULE_COLUMNS, csv_path=schedule_file),
+                SqliteTable(database_file, "resultados", RESULT_COLUMNS, csv_path=results_file))
+    if STORAGE_BACKEND == "parquet":
+        return (ParquetJournal(parquet_path(schedule_file), SCHEDULE_COLUMNS, csv_path=schedule_file),
+                ParquetJournal(parquet_path(results_file), RESULT_COLUMNS, csv_path=results_file))
+    return Journal(schedule_file, SCHEDULE_COLUMNS), Journal(results_file, RESULT_COLUMNS)
+
+# Função para exportar o conteúdo de um armazenamento (qualquer backend) para CSV
+def export_csv(store, path):
+    frame = store.load()[store.columns].copy()
+    if pd.api.types.is_datetime64_any_dtype(frame["Data"]):
+        frame["Data"] = frame["Data"].dt.strftime(DATE_FORMAT)
+    frame.to_csv(path, index=False)
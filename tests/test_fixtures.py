@@ -0,0 +1,25 @@
+from datetime import date
+
+import pandas as pd
+
+from fixtures import generate_fixtures
+
+# Nenhum jogador pode aparecer duas vezes no mesmo horário
+def assert_one_game_per_slot(games):
+    jogadores = games.melt(id_vars=["Data"], value_vars=["Jogador1", "Jogador2"])
+    assert not jogadores.duplicated(["Data", "value"]).any()
+
+def test_two_games_per_day_in_different_slots():
+    games, left_over = generate_fixtures({("B", 1): ["A", "B", "C"]}, date(2025, 2, 3), date(2025, 2, 3),
+                                         time_slots=["19:00", "20:00"], courts=2, max_per_day=2)
+    assert_one_game_per_slot(games)
+    assert len(games) + len(left_over) == 3
+    assert (games.melt(value_vars=["Jogador1", "Jogador2"])["value"].value_counts() <= 2).all()
+
+def test_existing_game_blocks_the_slot():
+    existing = pd.DataFrame({"Data": [pd.Timestamp("2025-02-03 19:00")], "Horario": ["19:00"], "Classe": ["C"],
+                             "Grupo": [1], "Jogador1": ["A"], "Jogador2": ["X"]})
+    games, left_over = generate_fixtures({("B", 1): ["A", "B"]}, date(2025, 2, 3), date(2025, 2, 3),
+                                         time_slots=["19:00", "20:00"], courts=2, max_per_day=2, existing=existing)
+    assert_one_game_per_slot(pd.concat([existing, games]))
+    assert list(games["Horario"]) == ["20:00"] and left_over.empty
@@ -0,0 +1,152 @@
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import pytest
+
+import storage
+from cache import SyncedState
+from storage import SCHEDULE_COLUMNS, Journal, SqliteTable
+
+# Função para montar jogos com datas e jogadores distintos
+def games(*numbers):
+    return pd.DataFrame({
+        "Data": [pd.Timestamp("2025-02-03 19:00") + pd.Timedelta(days=n) for n in numbers],
+        "Horario": ["19:00"] * len(numbers),
+        "Classe": ["B"] * len(numbers),
+        "Grupo": [1] * len(numbers),
+        "Jogador1": [f"Jogador {n}" for n in numbers],
+        "Jogador2": [f"Adversário {n}" for n in numbers],
+    })
+
+def players(journal):
+    return sorted(journal.load()["Jogador1"])
+
+@pytest.fixture
+def journal(tmp_path):
+    return Journal(str(tmp_path / "agendamentos.csv"), SCHEDULE_COLUMNS)
+
+# Faz a compactação falhar na troca indicada (os.replace para "dst" ou os.remove de "path")
+def fail_on(monkeypatch, func, target):
+    original = getattr(os, func)
+    def failing(*args):
+        if args[-1] == target:
+            raise OSError("falha simulada")
+        return original(*args)
+    monkeypatch.setattr(storage.os, func, failing)
+
+def test_compaction_interrupted_before_swap(journal, monkeypatch):
+    journal.append(games(1, 2))
+    journal.compact()
+    journal.append(games(3))
+    journal.delete(games(1))
+    # O CSV novo foi gravado e o log movido, mas o CSV não chegou a ser trocado
+    fail_on(monkeypatch, "replace", journal.path)
+    with pytest.raises(OSError):
+        journal.compact()
+    monkeypatch.undo()
+    assert os.path.exists(journal.tmp_path) and os.path.exists(journal.folded_path)
+
+    assert players(Journal(journal.path, SCHEDULE_COLUMNS)) == ["Jogador 2", "Jogador 3"]
+    assert not os.path.exists(journal.tmp_path) and not os.path.exists(journal.folded_path)
+    journal.append(games(4))
+    assert players(journal) == ["Jogador 2", "Jogador 3", "Jogador 4"]
+
+def test_compaction_interrupted_after_swap(journal, monkeypatch):
+    journal.append(games(1, 2))
+    journal.delete(games(2))
+    journal.append(games(2))
+    # O CSV novo já foi trocado; só falta apagar o log incorporado
+    fail_on(monkeypatch, "remove", journal.folded_path)
+    with pytest.raises(OSError):
+        journal.compact()
+    monkeypatch.undo()
+    assert os.path.exists(journal.folded_path) and not os.path.exists(journal.log_path)
+
+    # O log incorporado não pode ser reaplicado (as linhas já estão no CSV)
+    assert players(Journal(journal.path, SCHEDULE_COLUMNS)) == ["Jogador 1", "Jogador 2"]
+    assert not os.path.exists(journal.folded_path)
+
+def test_truncated_last_log_line(journal):
+    journal.append(games(1))
+    journal.append(games(2))
+    with open(journal.log_path, "rb+") as handle:
+        handle.truncate(os.path.getsize(journal.log_path) - 10)
+
+    # A operação incompleta é ignorada na leitura e descartada antes da próxima gravação
+    assert players(journal) == ["Jogador 1"]
+    journal.append(games(3))
+    assert players(journal) == ["Jogador 1", "Jogador 3"]
+    with open(journal.log_path, encoding="utf-8") as handle:
+        assert len(handle.readlines()) == 2
+
+def test_delete_before_reinsert(journal):
+    journal.append(games(1, 2))
+    journal.delete(games(1))
+    journal.append(games(1))
+    assert players(journal) == ["Jogador 1", "Jogador 2"]
+
+    # Uma exclusão só alcança linhas inseridas antes dela
+    journal.delete(games(3))
+    journal.append(games(3))
+    assert players(journal) == ["Jogador 1", "Jogador 2", "Jogador 3"]
+
+    # Depois da compactação o resultado é o mesmo
+    journal.compact()
+    assert players(Journal(journal.path, SCHEDULE_COLUMNS)) == ["Jogador 1", "Jogador 2", "Jogador 3"]
+
+def test_append_returns_signatures_of_its_own_write(journal):
+    journal.append(games(1))
+    before = journal.signature()
+    assert journal.append(games(2)) == (before, journal.signature())
+    before = journal.signature()
+    assert journal.delete(games(1)) == (before, journal.signature())
+
+# Estado mínimo que só conta as linhas
+class RowCount(SyncedState):
+    def _rebuild(self, frame):
+        self.rows = len(frame)
+
+    def _apply(self, frame):
+        self.rows += len(frame)
+
+@pytest.mark.parametrize("backend", ["csv", "sqlite"])
+def test_sync_keeps_signature_of_rows_read(tmp_path, backend):
+    if backend == "csv":
+        store = Journal(str(tmp_path / "agendamentos.csv"), SCHEDULE_COLUMNS)
+    else:
+        store = SqliteTable(str(tmp_path / "torneio.db"), "agendamentos", SCHEDULE_COLUMNS)
+    store.append(games(1))
+    state = RowCount()
+    signature = store.signature()
+    # Outra sessão grava entre a consulta da assinatura e a leitura
+    before, after = store.append(games(2))
+    state.sync(signature, store.load_signed)
+    state.apply(games(2), before, after)
+    # A gravação já estava nas linhas lidas: não é somada de novo
+    assert state.rows == 2
+    state.sync(store.signature(), store.load_signed)
+    assert state.rows == 2 and state.signature == store.signature()
+
+def append_many(path, first, count, compact_bytes):
+    journal = Journal(path, SCHEDULE_COLUMNS, compact_bytes=compact_bytes)
+    for number in range(first, first + count):
+        journal.append(games(number))
+
+@pytest.mark.parametrize("mode", ["threads", "processos"])
+def test_concurrent_appends(journal, mode):
+    # Log pequeno para que as compactações aconteçam no meio das gravações
+    args = [(journal.path, worker * 100, 25, 2048) for worker in range(4)]
+    if mode == "threads":
+        threads = [threading.Thread(target=append_many, args=arg) for arg in args]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    else:
+        with ProcessPoolExecutor(4) as pool:
+            list(pool.map(append_many, *zip(*args)))
+
+    expected = sorted(f"Jogador {worker * 100 + n}" for worker in range(4) for n in range(25))
+    assert players(Journal(journal.path, SCHEDULE_COLUMNS)) == expected
@@ -0,0 +1,157 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import date
+
+from conflicts import ConflictIndex
+from fixtures import DEFAULT_COURTS, DEFAULT_TIME_SLOTS
+from players import PlayerIndex
+from public import PUBLIC_DIR, PublicSnapshots
+from ratings import RatingEngine
+from standings import StandingsStore
+from storage import DATABASE_FILE, RESULTS_FILE, SCHEDULE_FILE, open_stores
+
+# Arquivo com o cadastro dos torneios
+TOURNAMENTS_FILE = os.environ.get("TORNEIO_CADASTRO", "torneios.json")
+
+# Quantos torneios ficam com os dados carregados em memória ao mesmo tempo
+MAX_LOADED_TOURNAMENTS = int(os.environ.get("TORNEIO_MAX_CARREGADOS", "8"))
+
+# Torneio usado quando não há cadastro (o torneio original do app)
+DEFAULT_TOURNAMENT = {
+    "id": "torneio-2025",
+    "nome": "Torneio de Tênis 2025",
+    "inicio": "2025-02-03",
+    "fim": "2025-03-16",
+    "classes": ["B", "C", "D"],
+    "grupos": [1, 2, 3, 4],
+    "jogadores": [
+        "Airton Barata", "Augusto E", "Carlos Frederico", "Danilo Alves", "Fernando Lino",
+        "Joel Pereira", "José Humberto", "Luiz Jr", "Lupesse Santana", "Matheus C",
+        "Túlio Ourique", "Vinicius Paiva", "Walmir Irineu", "Walter C", "Warwick Melo", "Willian F"
+    ],
+    "meta_semanal": 10,
+    "meta_total": 48,
+    "quadras": 2,
+    "horarios": ["07:00", "17:00", "19:00", "20:00"],
+    "agendamentos": SCHEDULE_FILE,
+    "resultados": RESULTS_FILE,
+    "pre_cadastrados": "jogos_pre_cadastrados.csv",
+    "banco": DATABASE_FILE,
+}
+
+# Configuração de um torneio (período, participantes, metas e arquivos)
+class Tournament:
+    def __init__(self, config):
+        self.id = config["id"]
+        self.nome = config.get("nome", self.id)
+        self.start_date = date.fromisoformat(config["inicio"])
+        self.end_date = date.fromisoformat(config["fim"])
+        self.classes = list(config.get("classes", DEFAULT_TOURNAMENT["classes"]))
+        self.grupos = list(config.get("grupos", DEFAULT_TOURNAMENT["grupos"]))
+        self.jogadores = list(config.get("jogadores", []))
+        self.meta_semanal = int(config.get("meta_semanal", DEFAULT_TOURNAMENT["meta_semanal"]))
+        self.meta_total = int(config.get("meta_total", DEFAULT_TOURNAMENT["meta_total"]))
+        # Quadras e horários disponíveis e dias em que cada jogador não pode jogar, usados pelo gerador de tabelas
+        self.quadras = int(config.get("quadras", DEFAULT_COURTS))
+        self.horarios = list(config.get("horarios", DEFAULT_TIME_SLOTS))
+        self.indisponibilidade = dict(config.get("indisponibilidade", {}))
+        # Máximo de jogos de um jogador por dia (opcional); sem ele, só o mesmo horário é conflito
+        self.max_jogos_dia = config.get("max_jogos_dia")
+        # Jogadores de cada grupo ({"B": {"1": [...]}}); sem cadastro, são deduzidos da agenda
+        self.grupos_jogadores = {
+            (classe, int(grupo)): list(players)
+            for classe, grupos in config.get("grupos_jogadores", {}).items()
+            for grupo, players in grupos.items()
+        }
+        # Sem caminhos explícitos, cada torneio guarda seus dados em dados/<id>/
+        pasta = os.path.join("dados", self.id)
+        self.schedule_file = config.get("agendamentos", os.path.join(pasta, "agendamentos.csv"))
+        self.results_file = config.get("resultados", os.path.join(pasta, "resultados.csv"))
+        self.pre_registered_file = config.get("pre_cadastrados", os.path.join(pasta, "jogos_pre_cadastrados.csv"))
+        self.database_file = config.get("banco", os.path.join(pasta, "torneio.db"))
+
+# Dados de um torneio: armazenamentos de agenda e resultados, classificação, ranking, índices de jogadores e de conflitos em memória
+class TournamentData:
+    def __init__(self, tournament):
+        self.tournament = tournament
+        for path in (tournament.schedule_file, tournament.results_file, tournament.database_file):
+            pasta = os.path.dirname(path)
+            if pasta:
+                os.makedirs(pasta, exist_ok=True)
+        self.schedule_store, self.results_store = open_stores(tournament.schedule_file, tournament.results_file, tournament.database_file)
+        self.standings = StandingsStore()
+        self.ratings = RatingEngine()
+        self.players = PlayerIndex()
+        self.conflicts = ConflictIndex(tournament.quadras, tournament.max_jogos_dia)
+        self.snapshots = {}  # pasta -> PublicSnapshots
+
+    # Snapshots públicos (classificação e agenda) do torneio, um gerador por pasta de destino
+    def public_snapshots(self, pasta=None):
+        pasta = pasta or PUBLIC_DIR
+        if pasta not in self.snapshots:
+            self.snapshots[pasta] = PublicSnapshots(self.tournament, self, pasta)
+        return self.snapshots[pasta]
+
+    # Função para carregar os resultados do período do torneio
+    def load_results(self):
+        return self.load_results_signed()[0]
+
+    # Função para carregar os resultados do período do torneio junto com a assinatura em que foram lidos
+    def load_results_signed(self):
+        return self.results_store.load_signed(self.tournament.start_date, self.tournament.end_date)
+
+    # Função para sincronizar com os resultados salvos a classificação, o ranking e o índice de jogadores;
+    # "lap" (opcional) é chamado com o nome de cada um depois de sincronizá-lo
+    def sync_results(self, lap=None):
+        signature = self.results_store.signature()
+        for name, state in (("classificação", self.standings), ("ranking", self.ratings), ("índice de jogadores", self.players)):
+            state.sync(signature, self.load_results_signed)
+            if lap:
+                lap(name)
+
+    # Função para aplicar resultados recém-gravados (entre as assinaturas "before" e "after") aos estados em memória
+    def apply_result(self, results, before, after):
+        for state in (self.standings, self.ratings, self.players):
+            state.apply(results, before, after)
+
+    # Libera as leituras em cache do torneio
+    def evict(self):
+        self.schedule_store.evict()
+        self.results_store.evict()
+
+# Cadastro de torneios. A configuração é lida uma vez; os dados de cada torneio
+# só são abertos no primeiro acesso e ficam em um LRU limitado.
+class TournamentRegistry:
+    def __init__(self, path=TOURNAMENTS_FILE, max_loaded=MAX_LOADED_TOURNAMENTS):
+        self.path = path
+        self.max_loaded = max_loaded
+        self.lock = threading.Lock()
+        self.loaded = OrderedDict()  # id -> TournamentData
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as handle:
+                configs = json.load(handle)["torneios"]
+        else:
+            configs = [DEFAULT_TOURNAMENT]
+        self.tournaments = OrderedDict((config["id"], Tournament(config)) for config in configs)
+
+    def ids(self):
+        return list(self.tournaments)
+
+    def get(self, tournament_id):
+        return self.tournaments[tournament_id]
+
+    # Função para obter os dados de um torneio, abrindo-os no primeiro acesso
+    def data(self, tournament_id):
+        with self.lock:
+            dados = self.loaded.get(tournament_id)
+            if dados is not None:
+                self.loaded.move_to_end(tournament_id)
+                return dados
+            dados = TournamentData(self.tournaments[tournament_id])
+            self.loaded[tournament_id] = dados
+            while len(self.loaded) > self.max_loaded:
+                _, antigo = self.loaded.popitem(last=False)
+                antigo.evict()
+            return dados